@@ -0,0 +1,182 @@
+"""Fixed-size circular record storage backed by a memory-mapped file.
+
+:class:`DiskRing` keeps the most recent records in a file that never grows past
+its initial size. The file is split into equally sized slots; once every slot
+is used the oldest record is overwritten. Writes land in the OS page cache via
+``mmap`` so they survive a crash of the TUI without an explicit flush.
+
+Run ``python -m disk_ring PATH`` to print the stored records, oldest first,
+one per line (the GPT log stores one JSON document per record, so the output
+is JSONL).
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+
+# magic, index of the next slot to write, number of stored records
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"RFR1"
+_LENGTH = struct.Struct("<I")
+
+
+class DiskRing:
+    """Store up to ``slots`` byte records in a circular on-disk buffer."""
+
+    def __init__(self, path: str, slots: int = 64, slot_size: int = 16384) -> None:
+        """Open (or create) the ring at ``path``.
+
+        An existing file whose size or header does not match the requested
+        layout is reset rather than misread.
+        """
+
+        if slots < 1 or slot_size <= _LENGTH.size:
+            raise ValueError("DiskRing needs at least one slot larger than 4 bytes")
+
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        self._lock = threading.Lock()
+        size = _HEADER.size + slots * slot_size
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            existing = os.fstat(fd).st_size
+            if existing != size:
+                os.ftruncate(fd, size)
+            self._buf = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        magic, head, count = _HEADER.unpack_from(self._buf, 0)
+        if existing != size or magic != _MAGIC or head >= slots or count > slots:
+            head, count = 0, 0
+            _HEADER.pack_into(self._buf, 0, _MAGIC, head, count)
+        self._head = head
+        self._count = count
+
+    @property
+    def capacity(self) -> int:
+        """Return the largest record size in bytes; longer records are rejected."""
+
+        return self.slot_size - _LENGTH.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, record: bytes) -> None:
+        """Store ``record`` as the newest entry, evicting the oldest if full.
+
+        Raises ``ValueError`` (leaving the ring unchanged) when ``record`` is
+        longer than :attr:`capacity`.
+        """
+
+        with self._lock:
+            self._write_slot(self._head, record)
+            self._head = (self._head + 1) % self.slots
+            self._count = min(self._count + 1, self.slots)
+            _HEADER.pack_into(self._buf, 0, _MAGIC, self._head, self._count)
+
+    def replace_last(self, record: bytes) -> None:
+        """Overwrite the newest entry in place (appends when the ring is empty)."""
+
+        with self._lock:
+            if self._count:
+                self._write_slot((self._head - 1) % self.slots, record)
+                return
+        self.append(record)
+
+    def last(self) -> bytes | None:
+        """Return the newest record, or ``None`` when the ring is empty."""
+
+        with self._lock:
+            if not self._count:
+                return None
+            return self._read_slot((self._head - 1) % self.slots)
+
+    def records(self) -> list[bytes]:
+        """Return all stored records from oldest to newest."""
+
+        with self._lock:
+            first = (self._head - self._count) % self.slots
+            return [
+                self._read_slot((first + i) % self.slots) for i in range(self._count)
+            ]
+
+    def close(self) -> None:
+        """Flush pending writes and release the memory map."""
+
+        with self._lock:
+            if not self._buf.closed:
+                self._buf.flush()
+                self._buf.close()
+
+    def _write_slot(self, slot: int, record: bytes) -> None:
+        if len(record) > self.capacity:
+            raise ValueError(
+                f"record of {len(record)} bytes exceeds slot capacity {self.capacity}"
+            )
+        offset = _HEADER.size + slot * self.slot_size
+        _LENGTH.pack_into(self._buf, offset, len(record))
+        start = offset + _LENGTH.size
+        self._buf[start : start + len(record)] = record
+
+    def _read_slot(self, slot: int) -> bytes:
+        return _slot_record(self._buf, slot, self.slot_size)
+
+
+def _slot_record(buf, slot: int, slot_size: int) -> bytes:
+    offset = _HEADER.size + slot * slot_size
+    (length,) = _LENGTH.unpack_from(buf, offset)
+    start = offset + _LENGTH.size
+    return bytes(buf[start : start + min(length, slot_size - _LENGTH.size)])
+
+
+def read_records(path: str, slots: int = 64, slot_size: int = 16384) -> list[bytes]:
+    """Return the records of the ring at ``path`` without modifying it.
+
+    Unlike opening a :class:`DiskRing`, a file whose size or header does not
+    match the layout raises ``ValueError`` instead of being reset.
+    """
+
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) != _HEADER.size + slots * slot_size:
+        raise ValueError(f"{path} is not a {slots}x{slot_size} ring")
+    magic, head, count = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or head >= slots or count > slots:
+        raise ValueError(f"{path} has no valid ring header")
+    first = (head - count) % slots
+    return [_slot_record(data, (first + i) % slots, slot_size) for i in range(count)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Print the records of a DiskRing.")
+    parser.add_argument("path")
+    parser.add_argument("--slots", type=int, default=64)
+    parser.add_argument("--slot-size", type=int, default=16384)
+    args = parser.parse_args(argv)
+    try:
+        records = read_records(
+            os.path.expanduser(args.path), args.slots, args.slot_size
+        )
+    except (OSError, ValueError) as e:
+        print(f"disk_ring: {e}", file=sys.stderr)
+        return 1
+    out = sys.stdout.buffer
+    for record in records:
+        out.write(record + b"\n")
+    out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,7 @@
 import os
+import threading
+import time
+from collections import OrderedDict
 
 try:
     from dotenv import load_dotenv
@@ -14,6 +17,14 @@ logger = setup_logger(__name__)
 
 _genius_client = None
 
+# Lyrics keyed by ``(song, artist)`` as ``(stored_at, lyrics)``. Misses are
+# kept only briefly so a track Genius lacks isn't re-queried on every replay,
+# yet gets another chance later in the session.
+LYRICS_CACHE_SIZE = 128
+LYRICS_MISS_TTL = 300.0
+_lyrics_cache: OrderedDict = OrderedDict()
+_lyrics_lock = threading.Lock()
+
 
 def _get_genius_client():
     """Return a cached lyricsgenius client, or None when unavailable."""
@@ -42,18 +53,43 @@ def _get_genius_client():
     return _genius_client
 
 
+def _search_lyrics(song_name, artist_name):
+    """Look up lyrics on Genius, memoizing results per ``(song, artist)``.
+
+    Found lyrics are kept (LRU); "not found" answers expire after
+    :data:`LYRICS_MISS_TTL`. Exceptions and a missing client are not cached,
+    so those lookups are retried next time.
+    """
+
+    key = (song_name, artist_name)
+    with _lyrics_lock:
+        cached = _lyrics_cache.get(key)
+        if cached is not None:
+            stored_at, lyrics = cached
+            if lyrics is not None or time.monotonic() - stored_at < LYRICS_MISS_TTL:
+                _lyrics_cache.move_to_end(key)
+                return lyrics
+
+    genius = _get_genius_client()
+    if genius is None:
+        return None
+    song = genius.search_song(song_name, artist_name)
+    lyrics = song.lyrics if song and song.lyrics else None
+
+    with _lyrics_lock:
+        _lyrics_cache[key] = (time.monotonic(), lyrics)
+        _lyrics_cache.move_to_end(key)
+        if len(_lyrics_cache) > LYRICS_CACHE_SIZE:
+            _lyrics_cache.popitem(last=False)
+    return lyrics
+
+
 def get_lyrics(song_name, artist_name):
     """
     Fetch raw (unsynced) lyrics from Genius as a fallback.
     """
     try:
-        genius = _get_genius_client()
-        if genius is None:
-            return None
-        song = genius.search_song(song_name, artist_name)
-        if song and song.lyrics:
-            return song.lyrics
-        return None
+        return _search_lyrics(song_name, artist_name)
     except Exception as e:
         logger.error("Genius error: %s", e)
         return None
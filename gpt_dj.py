@@ -13,12 +13,15 @@ except ModuleNotFoundError:  # pragma: no cover
         return False
 from gpt_utils import count_tokens
 from logger_utils import setup_logger
+from response_cache import ResponseCache
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 
 console = Console()
 
+DEFAULT_CACHE_PATH = "~/RadioFree/cache/gpt_responses.json"
+
 
 class RadioFreeDJ:
     def __init__(
@@ -28,6 +31,7 @@ class RadioFreeDJ:
         log_path="requests.log",
         system_prompt=None,
         on_response=None,
+        cache_path=None,
     ):
         load_dotenv()
 
@@ -48,6 +52,9 @@ class RadioFreeDJ:
             self.client = openai.OpenAI(api_key=self.api_key)
 
         self.logger = setup_logger("RadioFreeDJ", self.log_path)
+        self.response_cache = ResponseCache(
+            cache_path or os.getenv("RADIOFREE_GPT_CACHE", DEFAULT_CACHE_PATH)
+        )
 
         # For toggling logs view
         self.show_logs = False
@@ -60,7 +67,10 @@ class RadioFreeDJ:
             return 0
 
     def ask(
-        self, prompt: str, cancel_event: threading.Event | None = None
+        self,
+        prompt: str,
+        cancel_event: threading.Event | None = None,
+        bypass_cache: bool = False,
     ) -> str | None:
         """Send *prompt* to the active model and return the response.
 
@@ -70,10 +80,24 @@ class RadioFreeDJ:
             The user prompt to send to the model.
         cancel_event:
             Optional event that, when set, aborts waiting for the response.
+        bypass_cache:
+            Always query the model. Use for requests where a repeated prompt
+            should yield a different answer, such as song recommendations.
         """
 
+        cache_key = None
+        if not bypass_cache:
+            cache_key = self.response_cache.key(
+                self.active_model, self.system_prompt, prompt
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("Cached response for prompt:\n%s", cached)
+                self._emit_response(prompt, cached)
+                return cached
+
         token_count = self.count_tokens(prompt)
-        self.logger.debug(f"Prompt sent ({token_count} tokens):\n{prompt}")
+        self.logger.debug("Prompt sent (%d tokens):\n%s", token_count, prompt)
 
         console.print(f"[cyan]🔍 Sending to GPT model:[/cyan] {self.active_model}")
         console.print(Panel(prompt, title="🧠 GPT Prompt"))
@@ -103,17 +127,22 @@ class RadioFreeDJ:
                     t.join(0.1)
                 response = result[0]
 
-            self.logger.info(f"Response for prompt:\n{response}")
-            if self.on_response:
-                try:
-                    self.on_response(prompt, response)
-                except Exception as cb_err:
-                    self.logger.error(f"on_response callback error: {cb_err}")
+            self.logger.info("Response for prompt:\n%s", response)
+            if cache_key and response and response != "[gpt-error]":
+                self.response_cache.put(cache_key, response)
+            self._emit_response(prompt, response)
             return response
         except Exception as e:
-            self.logger.error(f"Error getting GPT response: {e}")
+            self.logger.error("Error getting GPT response: %s", e)
             return None
 
+    def _emit_response(self, prompt: str, response: str | None) -> None:
+        if self.on_response:
+            try:
+                self.on_response(prompt, response)
+            except Exception as cb_err:
+                self.logger.error("on_response callback error: %s", cb_err)
+
     def _ask_openai(self, prompt: str) -> str:
         try:
             messages = []
@@ -126,11 +155,11 @@ class RadioFreeDJ:
             )
             return response.choices[0].message.content.strip()
         except OpenAIError as e:
-            self.logger.error(f"OpenAI request failed: {e}")
+            self.logger.error("OpenAI request failed: %s", e)
             console.print(Panel(str(e), title="❌ GPT API Error", border_style="red"))
             return "[gpt-error]"
         except Exception as e:
-            self.logger.error(f"Unexpected error during OpenAI call: {e}")
+            self.logger.error("Unexpected error during OpenAI call: %s", e)
             console.print(Panel(str(e), title="❌ GPT Error", border_style="red"))
             return "[gpt-error]"
 
@@ -5,9 +5,10 @@ import tiktoken
 from rich.console import Console
 from rich.panel import Panel
 from logger_utils import setup_logger
-import json
 import re
 
+import json_utils
+
 console = Console()
 logger = setup_logger(__name__)
 
@@ -39,14 +40,14 @@ def parse_json_response(text: str):
     Returns a dictionary if successful, otherwise ``None``.
     """
     try:
-        return json.loads(text)
+        return json_utils.loads(text)
     except Exception:
         match = re.search(r"\{.*?\}", text, re.DOTALL)
         if not match:
             logger.warning("No JSON object detected in response")
             return None
         try:
-            return json.loads(match.group(0))
-        except json.JSONDecodeError as e:
+            return json_utils.loads(match.group(0))
+        except json_utils.JSONDecodeError as e:
             logger.error("JSON decode error: %s", e)
             return None
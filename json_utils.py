@@ -0,0 +1,38 @@
+"""JSON helpers that use :mod:`orjson` when it is available.
+
+orjson parses and serializes several times faster than the standard library
+and works with ``bytes`` directly, which suits the log and cache files written
+on hot paths. Without it the helpers fall back to :mod:`json` and produce the
+same compact UTF-8 output.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch either.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON document from ``str`` or ``bytes``."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to compact (or two-space indented) UTF-8 bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -1,97 +1,191 @@
 """Utilities for fetching and synchronizing song lyrics."""
 
 import json
+import os
 import re
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from genius_utils import get_lyrics
 import requests
 from requests.exceptions import RequestException
 from logger_utils import setup_logger
+from response_cache import ResponseCache
 
 logger = setup_logger(__name__)
 
+DEFAULT_CACHE_PATH = "~/RadioFree/cache/lyrics.json"
+
+# Matches every "[MM:SS.ss] lyric" line of an LRC document in one pass.
+_LRC_LINE_RE = re.compile(r"^\[(\d+):(\d+\.\d+)\](.*)", re.MULTILINE)
+
 
 class LyricsSyncManager:
     """Fetch and synchronize time-coded song lyrics."""
 
     API_URL = "https://lrclib.net/api/get"
+    # Prefetched lyrics kept for upcoming tracks, least recently used first.
+    PREFETCH_CACHE_SIZE = 16
+    # Prefetches that found nothing are not retried for this many seconds;
+    # Auto-DJ asks for the upcoming tracks on every playback tick.
+    PREFETCH_MISS_TTL = 300.0
+    PREFETCH_MISS_SIZE = 64
 
-    def __init__(self, spotify_controller):
+    # Shared by every manager: caps concurrent lyric requests and reuses the
+    # worker threads instead of spawning one per track change.
+    _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lyrics")
+
+    def __init__(self, spotify_controller, cache_path=None):
         self.spotify = spotify_controller
         self.timestamps: list[int] = []
         self.lines: list[str] = []
         self.current_index = 0
+        self._last_sync_bucket = -1
         self.logger = logger
-        self._fetch_thread: threading.Thread | None = None
+        # one keep-alive connection to lrclib instead of a handshake per track
+        self.session = requests.Session()
+        self._future: Future | None = None
+        # bumped by start() so a slow fetch for a skipped track is discarded
+        self._generation = 0
         self.fetching = False
-        # simple cache for prefetched lyrics
-        self._cache: dict[tuple[str, str], tuple[list[int], list[str]]] = {}
+        # set whenever the current track's lyrics (or "not found") are in
+        self.ready_event = threading.Event()
+        self._cache: OrderedDict[tuple[str, str], tuple[list[int], list[str]]] = (
+            OrderedDict()
+        )
+        # prefetches still in flight, so start() can share them
+        self._prefetching: dict[tuple[str, str], Future] = {}
+        # (track, artist) -> monotonic time of a prefetch that found nothing
+        self._misses: OrderedDict[tuple[str, str], float] = OrderedDict()
+        # raw LRC text persisted across sessions so replays skip lrclib
+        self.disk_cache = ResponseCache(
+            cache_path or os.getenv("RADIOFREE_LYRICS_CACHE", DEFAULT_CACHE_PATH)
+        )
 
     def start(self, track_name, artist_name, album_name="", duration_ms=0):
-        """Start fetching lyrics in a background thread.
+        """Start fetching lyrics on the shared worker pool.
 
-        If lyrics have been prefetched, they are loaded immediately.
+        If lyrics have been prefetched, they are loaded immediately; if a
+        prefetch for the track is still running, its result is reused.
         """
+        self._generation += 1
+        self._cancel_pending()
         self.current_index = 0
+        self._last_sync_bucket = -1
         self.timestamps = []
         self.lines = []
 
-        cached = self._cache.pop((track_name, artist_name), None)
+        key = (track_name, artist_name)
+        cached = self._cache.pop(key, None)
         if cached:
             self.timestamps, self.lines = cached
             self.fetching = False
+            self.ready_event.set()
             return
 
         self.fetching = True
-        args = (track_name, artist_name, album_name, duration_ms)
-        self._fetch_thread = threading.Thread(
-            target=self._load_lyrics, args=args, daemon=True
+        self.ready_event.clear()
+        future = self._prefetching.get(key)
+        if future is None:
+            future = self._EXECUTOR.submit(
+                self._fetch, track_name, artist_name, album_name, duration_ms
+            )
+        self._future = future
+        future.add_done_callback(
+            partial(self._apply_lyrics, self._generation, track_name, artist_name)
         )
-        self._fetch_thread.start()
+
+    def _cancel_pending(self) -> None:
+        """Drop the previous track's fetch if it has not started yet.
+
+        A fetch already on the wire is left to finish: its result is still
+        persisted for later plays, and ``_apply_lyrics`` ignores it for this
+        track. Shared prefetch futures are never cancelled.
+        """
+        future = self._future
+        if future is not None and future not in self._prefetching.values():
+            future.cancel()
+        self._future = None
 
     def prefetch(self, track_name, artist_name, album_name="", duration_ms=0) -> None:
         """Fetch lyrics ahead of time and store them in the cache."""
 
-        if (track_name, artist_name) in self._cache:
+        key = (track_name, artist_name)
+        if key in self._cache or key in self._prefetching:
             return
+        missed_at = self._misses.get(key)
+        if missed_at is not None:
+            if time.monotonic() - missed_at < self.PREFETCH_MISS_TTL:
+                return
+            del self._misses[key]
+
+        future = self._EXECUTOR.submit(
+            self._fetch, track_name, artist_name, album_name, duration_ms
+        )
+        self._prefetching[key] = future
+        # Without a duration only the disk cache is consulted, so an empty
+        # result there is not a real miss and must not block a later lookup.
+        future.add_done_callback(
+            partial(self._store_prefetch, key, duration_ms >= 1000)
+        )
+
+    def prefetch_upcoming(self, tracks) -> None:
+        """Prefetch lyrics for upcoming tracks, in queue order.
+
+        Each entry holds :meth:`prefetch`'s positional arguments: ``(track,
+        artist)`` optionally followed by album name and ``duration_ms``.
+        Without a duration only previously stored lyrics can be found.
+        """
 
-        threading.Thread(
-            target=self._prefetch_worker,
-            args=(track_name, artist_name, album_name, duration_ms),
-            daemon=True,
-        ).start()
+        for track in tracks:
+            if track[0] and track[1]:
+                self.prefetch(*track)
 
-    def _prefetch_worker(self, track_name, artist_name, album_name, duration_ms):
-        ts, ls = self.fetch_lyrics(
+    def _fetch(self, track_name, artist_name, album_name, duration_ms):
+        return self.fetch_lyrics(
             artist_name=artist_name,
             track_name=track_name,
             album_name=album_name,
             duration_ms=duration_ms,
         )
+
+    def _store_prefetch(self, key, looked_up: bool, future: Future) -> None:
+        self._prefetching.pop(key, None)
+        if future.cancelled():
+            return
+        ts, ls = future.result() if future.exception() is None else ([], [])
         if ts and ls:
-            # limit cache size to three entries
-            if len(self._cache) >= 3:
-                self._cache.pop(next(iter(self._cache)))
-            self._cache[(track_name, artist_name)] = (ts, ls)
+            self._cache[key] = (ts, ls)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.PREFETCH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        elif looked_up:
+            self._misses[key] = time.monotonic()
+            self._misses.move_to_end(key)
+            while len(self._misses) > self.PREFETCH_MISS_SIZE:
+                self._misses.popitem(last=False)
 
-    def _load_lyrics(self, track_name, artist_name, album_name, duration_ms):
+    def _apply_lyrics(self, generation, track_name, artist_name, future: Future):
+        if generation != self._generation:
+            return
         try:
-            ts, ls = self.fetch_lyrics(
-                artist_name=artist_name,
-                track_name=track_name,
-                album_name=album_name,
-                duration_ms=duration_ms,
-            )
+            ts, ls = future.result()
             if ts and ls:
                 self.timestamps, self.lines = ts, ls
             else:
                 raise ValueError("Empty LRC result")
         except Exception as e:
-            self.logger.warning(f"No lyrics for '{track_name}' by '{artist_name}': {e}")
+            self.logger.warning(
+                "No lyrics for '%s' by '%s': %s", track_name, artist_name, e
+            )
             self.timestamps = [0]
             self.lines = ["[dim]No lyrics found[/dim]"]
         finally:
+            self._last_sync_bucket = -1
             self.fetching = False
+            self.ready_event.set()
 
     @property
     def ready(self) -> bool:
@@ -99,10 +193,28 @@ class LyricsSyncManager:
         return not self.fetching and bool(self.lines)
 
     def fetch_lyrics(self, artist_name, track_name, album_name, duration_ms):
+        cache_key = ResponseCache.key(
+            str(artist_name).casefold(), str(track_name).casefold()
+        )
+        cached = self.disk_cache.get(cache_key)
+        if cached:
+            self.logger.debug("LRC cache hit for %s - %s", artist_name, track_name)
+            return self.parse_lrc(cached)
+
+        ts, lines, lrc_text = self._request_lrc(
+            artist_name, track_name, album_name, duration_ms
+        )
+        if ts and lines:
+            self.disk_cache.put(cache_key, lrc_text)
+        return ts, lines
+
+    def _request_lrc(self, artist_name, track_name, album_name, duration_ms):
+        """Query lrclib and return ``(timestamps, lines, raw_lrc_text)``."""
+
         # skip any sub‑one‑second durations
         if duration_ms < 1000:
             self.logger.debug("duration_ms < 1000 (%d), skipping fetch", duration_ms)
-            return [], []
+            return [], [], ""
 
         # convert to seconds and clamp
         secs = max(1, min(duration_ms // 1000, 3600))
@@ -115,7 +227,7 @@ class LyricsSyncManager:
         self.logger.debug("Requesting LRC: %s with %s", self.API_URL, params)
 
         try:
-            resp = requests.get(self.API_URL, params=params, timeout=5)
+            resp = self.session.get(self.API_URL, params=params, timeout=5)
             self.logger.debug("HTTP %s %s", resp.status_code, resp.url)
             snippet = resp.text.strip().splitlines()[:3]
             self.logger.debug("Body snippet:\n%s", "\n".join(snippet))
@@ -132,32 +244,35 @@ class LyricsSyncManager:
             else:
                 lrc_text = text
 
-            return self.parse_lrc(lrc_text)
+            return (*self.parse_lrc(lrc_text), lrc_text)
 
         except requests.RequestException as err:
             self.logger.error("LRC fetch error: %s", err)
-            return [], []
+            return [], [], ""
         except json.JSONDecodeError:
             # not JSON, fall back to raw LRC parse
-            return self.parse_lrc(resp.text)
+            return (*self.parse_lrc(resp.text), resp.text)
 
     def parse_lrc(self, lrc_text):
         """
         Parse LRC “[MM:SS.ss] line” into ([ms…], [str…]).
         """
-        pattern = re.compile(r"\[(\d+):(\d+\.\d+)\](.*)")
         ts, lines = [], []
-        for line in lrc_text.splitlines():
-            m = pattern.match(line)
-            if not m:
-                continue
-            mins = int(m.group(1))
-            secs = float(m.group(2))
-            ts.append(int((mins * 60 + secs) * 1000))
-            lines.append(m.group(3).strip())
+        for mins, secs, text in _LRC_LINE_RE.findall(lrc_text):
+            ts.append(int((int(mins) * 60 + float(secs)) * 1000))
+            lines.append(text.strip())
         return ts, lines
 
     def sync(self, progress_ms):
+        """Advance ``current_index`` to the line playing at ``progress_ms``.
+
+        Repeated calls within the same 100 ms window are skipped; lyric timing
+        does not need finer resolution than that.
+        """
+        bucket = progress_ms // 100
+        if bucket == self._last_sync_bucket:
+            return
+        self._last_sync_bucket = bucket
         while (
             self.current_index + 1 < len(self.timestamps)
             and progress_ms >= self.timestamps[self.current_index + 1]
@@ -3,37 +3,45 @@
 Press ``?`` during playback to open a help popup describing all controls.
 """
 
+import atexit
 import threading
 import time
 import os
-import json
+from collections import deque
 import re
+import selectors
+import sys
 try:
     from dotenv import load_dotenv
 except ModuleNotFoundError:  # pragma: no cover
     def load_dotenv(*_args, **_kwargs):
         return False
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from time import sleep
 
 from gpt_dj import RadioFreeDJ
 from mystery_mode import MysteryModeManager
 from spotify_utils import SpotifyController
-from upnext import UpNextManager
+from upnext import UpNextManager, ask_theme
 from genius_utils import get_lyrics
 from lyrics_sync import LyricsSyncManager
 from lastfm_utils import update_now_playing, scrobble
 from requests.exceptions import ReadTimeout, RequestException
 
-from queue import Queue
+from queue import Empty, Full, Queue
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 from rich.console import Console
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
 from rich.prompt import Prompt
+from rich.style import Style
 from rich.text import Text
 
+from disk_ring import DiskRing
+import json_utils
 from logger_utils import setup_logger
 from freeze_watchdog import Heartbeat, log_if_slow, start_freeze_watchdog
 
@@ -42,8 +50,8 @@ load_dotenv()
 
 # === Load Prompt Templates ===
 prompts_path = os.path.join(os.path.dirname(__file__), "prompts.json")
-with open(prompts_path, "r", encoding="utf-8") as f:
-    prompt_templates = json.load(f)
+with open(prompts_path, "rb") as f:
+    prompt_templates = json_utils.loads(f.read())
 
 # === Setup Logging ===
 log_path = os.path.join(os.path.dirname(__file__), "requests.log")
@@ -87,18 +95,56 @@ COMMAND_LABELS = {
     "page_down": "GPT Log Down",
     "m": "Toggle Mystery Mode",
 }
+COMMAND_LOG_STRINGS = {key: f"{key} → {label}" for key, label in COMMAND_LABELS.items()}
 COMMAND_LOG_FILE = os.path.join(os.path.dirname(__file__), "commands.log")
+_command_log = None
+# (epoch second, formatted local time) of the last command log entry
+_command_log_stamp: tuple[int, str] = (-1, "")
+
+
+def describe_command(choice: str, label_override: str | None = None) -> str:
+    """Return the ``"<key> → <label>"`` string shown and logged for ``choice``."""
+
+    if label_override:
+        return f"{choice} → {label_override}"
+    return COMMAND_LOG_STRINGS.get(choice) or f"{choice} → Unknown"
+
+
+def _get_command_log():
+    """Return the command log handle, opening it once on first use.
+
+    The file is line buffered, so each entry reaches the OS on its newline
+    without reopening the file per keystroke.
+    """
+
+    global _command_log
+    if _command_log is None:
+        _command_log = open(COMMAND_LOG_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(_command_log.close)
+    return _command_log
+
+
+def _command_timestamp() -> str:
+    """Return the local ``%Y-%m-%d %H:%M:%S`` time, formatted once per second."""
+
+    global _command_log_stamp
+    now = int(time.time())
+    if now != _command_log_stamp[0]:
+        _command_log_stamp = (
+            now,
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+        )
+    return _command_log_stamp[1]
 
 
 def log_command(choice: str, label_override: str | None = None):
     label = label_override or COMMAND_LABELS.get(choice, "Unknown")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    entry = f"{timestamp} - {choice} → {label}\n"
+    timestamp = _command_timestamp()
+    entry = f"{timestamp} - {describe_command(choice, label_override)}\n"
     try:
-        with open(COMMAND_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(entry)
+        _get_command_log().write(entry)
     except Exception as e:
-        logger.warning(f"Could not write command log: {e}")
+        logger.warning("Could not write command log: %s", e)
     return label
 
 
@@ -109,17 +155,73 @@ lyrics_cursor = 0
 
 show_gpt_log = True
 show_keybinds = False
-command_log_buffer = []
-notifications = []
+command_log_buffer: deque[str] = deque(maxlen=50)
+notifications: deque[Text] = deque(maxlen=3)
 user_input_queue = Queue()
+background_tasks: Queue = Queue()
+# Spotify playback commands get their own worker so a skip never waits
+# behind a slow GPT request on ``background_tasks``.
+control_tasks: Queue = Queue()
+# Track changes (lyrics reset, scrobble, now-playing) likewise never queue
+# behind GPT work; anything slow they trigger goes back to ``background_tasks``.
+track_change_tasks: Queue = Queue()
+# Holds only the newest ``(monotonic fetch time, playback)`` pair published by
+# ``poll_playback``.
+playback_snapshots: Queue = Queue(maxsize=1)
+# Set to make the poller fetch immediately instead of finishing its wait.
+playback_poll_now = threading.Event()
+# Between polls the UI advances progress locally (see ``interpolate_progress``),
+# so Spotify only needs to be asked occasionally: at the expected end of each
+# track, right after our own commands, and otherwise every
+# ``RADIOFREE_POLL_SECONDS`` to pick up changes made from other devices.
+PLAYBACK_POLL_INTERVAL = float(os.getenv("RADIOFREE_POLL_SECONDS", "5") or 5)
 cancel_event = threading.Event()
 refresh_event = threading.Event()
+auto_dj_pending = threading.Event()
 
-gpt_log_buffer = []
+gpt_log_buffer: deque[tuple[str, str]] = deque(maxlen=50)
 gpt_log_scroll = 0
 
 
-GPT_LOG_FILE = os.path.expanduser("~/RadioFree/logs/gpt_log.jsonl")
+GPT_LOG_FILE = os.path.expanduser("~/RadioFree/logs/gpt_log.ring")
+# Prompts can embed full lyrics; keep the on-disk copy short enough that a
+# record fits comfortably inside one ring slot.
+GPT_LOG_PROMPT_CHARS = 2000
+_gpt_ring: DiskRing | None = None
+
+
+def _get_gpt_ring() -> DiskRing | None:
+    """Return the on-disk GPT log ring, opening it on first use."""
+
+    global _gpt_ring
+    if _gpt_ring is None:
+        try:
+            _gpt_ring = DiskRing(GPT_LOG_FILE)
+        except OSError as e:
+            logger.warning("Failed to open GPT log: %s", e)
+    return _gpt_ring
+
+
+def _encode_gpt_entry(entry: dict, capacity: int) -> bytes:
+    """Encode ``entry`` as JSON of at most ``capacity`` bytes.
+
+    The longer of the prompt and response is shortened (marked with "…")
+    until the document fits, so a ring slot never holds cut-off JSON.
+    """
+
+    record = dict(entry, prompt=entry["prompt"][:GPT_LOG_PROMPT_CHARS])
+    data = json_utils.dumps(record)
+    while len(data) > capacity:
+        field = max(("prompt", "response"), key=lambda k: len(record[k]))
+        text = record[field]
+        if len(text) <= 1:
+            break
+        # Every character encodes to at least one byte, so dropping the
+        # overshoot (plus room for the marker) converges in a few passes.
+        keep = max(len(text) - (len(data) - capacity) - 3, 0)
+        record[field] = text[:keep] + "…"
+        data = json_utils.dumps(record)
+    return data
 
 
 def log_gpt(prompt: str, response: str):
@@ -132,19 +234,14 @@ def log_gpt(prompt: str, response: str):
         "response": (response or "[No response]").strip(),
     }
     gpt_log_buffer.append((entry["prompt"], entry["response"]))
-    if len(gpt_log_buffer) > 50:
-        gpt_log_buffer.pop(0)
 
     # Always snap back to the latest response when a new entry arrives so the
     # log view mirrors fresh GPT output.
     gpt_log_scroll = 0
 
-    try:
-        os.makedirs(os.path.dirname(GPT_LOG_FILE), exist_ok=True)
-        with open(GPT_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
-    except Exception as e:
-        logger.warning(f"Failed to write GPT log: {e}")
+    ring = _get_gpt_ring()
+    if ring is not None:
+        ring.append(_encode_gpt_entry(entry, ring.capacity))
 
 
 def overwrite_latest_gpt_log(response: str) -> None:
@@ -154,19 +251,16 @@ def overwrite_latest_gpt_log(response: str) -> None:
         return
     prompt, _ = gpt_log_buffer[-1]
     gpt_log_buffer[-1] = (prompt, response)
+    ring = _get_gpt_ring()
+    last = ring.last() if ring is not None else None
+    if last is None:
+        return
     try:
-        if os.path.exists(GPT_LOG_FILE):
-            with open(GPT_LOG_FILE, "r+", encoding="utf-8") as handle:
-                lines = handle.readlines()
-                if lines:
-                    entry = json.loads(lines[-1])
-                    entry["response"] = response
-                    lines[-1] = json.dumps(entry) + "\n"
-                    handle.seek(0)
-                    handle.writelines(lines)
-                    handle.truncate()
+        entry = json_utils.loads(last)
+        entry["response"] = response
+        ring.replace_last(_encode_gpt_entry(entry, ring.capacity))
     except Exception as exc:
-        logger.warning(f"Failed to overwrite GPT log entry: {exc}")
+        logger.warning("Failed to overwrite GPT log entry: %s", exc)
 
 
 # === instantiate radiofreedj ===
@@ -194,7 +288,7 @@ mystery_manager = MysteryModeManager(
 )
 lyrics_manager = LyricsSyncManager(spotify_controller)
 console = Console()
-last_song = {"name": None, "artist": None, "started": 0}
+last_song = {"id": None, "name": None, "artist": None, "started": 0}
 auto_dj_counter = 0
 
 # ─────────────────────────────────────────────────────────────
@@ -204,8 +298,6 @@ auto_dj_counter = 0
 
 def notify(message: str, style="bold yellow"):
     notifications.append(Text(message, style=style))
-    if len(notifications) > 3:
-        notifications.pop(0)
 
 
 def log_song_history(
@@ -226,8 +318,137 @@ def log_song_history(
         "recommended_count": 1 if queued_by == "gpt" else 0,
     }
 
-    with open(history_file, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    with open(history_file, "ab") as f:
+        f.write(json_utils.dumps(entry) + b"\n")
+
+
+def run_in_background(func, *args) -> None:
+    """Queue ``func(*args)`` for the background worker thread."""
+
+    background_tasks.put((func, args))
+
+
+def run_control(func, *args) -> None:
+    """Queue the Spotify playback command ``func(*args)`` for the control thread."""
+
+    control_tasks.put((func, args))
+
+
+def run_track_change(*args) -> None:
+    """Queue :func:`handle_track_change` for the track-change thread."""
+
+    track_change_tasks.put((handle_track_change, args))
+
+
+def background_worker(tasks: Queue = background_tasks, on_done=None) -> None:
+    """Run queued network-heavy tasks one at a time, off the UI loop.
+
+    ``on_done`` is called after every task, e.g. to trigger a playback poll.
+    """
+
+    while True:
+        func, args = tasks.get()
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("Background task %s failed", func.__name__)
+        if on_done is not None:
+            on_done()
+
+
+def toggle_playback() -> None:
+    """Pause when playing, otherwise resume."""
+
+    playback = spotify_controller.current_playback()
+    if playback and playback.get("is_playing"):
+        spotify_controller.pause()
+        notify("⏸ Paused playback", style="yellow")
+    else:
+        spotify_controller.resume()
+        notify("▶️ Resumed playback", style="yellow")
+
+
+def play_mystery_choice(index: int) -> None:
+    """Play the mystery pick at ``index`` and report the outcome."""
+
+    success, message = mystery_manager.play_choice(index)
+    style = "magenta" if success else "red"
+    notify(message, style=style)
+
+
+def publish_playback(playback: dict | None) -> None:
+    """Replace any unread snapshot in ``playback_snapshots`` with ``playback``."""
+
+    snapshot = (time.monotonic(), playback)
+    while True:
+        try:
+            playback_snapshots.put_nowait(snapshot)
+            return
+        except Full:
+            try:
+                playback_snapshots.get_nowait()
+            except Empty:
+                pass
+
+
+def playback_duration(playback: dict | None) -> int:
+    """Return the playing item's ``duration_ms``, or 0 when nothing is loaded."""
+
+    item = playback.get("item") if playback else None
+    return item.get("duration_ms", 0) if item else 0
+
+
+def item_details(item: dict) -> tuple[int, str]:
+    """Return ``(duration_ms, album_name)`` for a playback item."""
+
+    album = item.get("album")
+    return item.get("duration_ms", 0), album.get("name", "") if album else ""
+
+
+def interpolate_progress(playback: dict, fetched_at: float) -> int:
+    """Return ``progress_ms`` advanced by the time elapsed since ``fetched_at``."""
+
+    progress = playback.get("progress_ms") or 0
+    if playback.get("is_playing"):
+        progress += int((time.monotonic() - fetched_at) * 1000)
+    duration = playback_duration(playback)
+    if duration:
+        progress = min(progress, duration)
+    # Clamp here so every consumer (timestamps, lyrics sync) sees >= 0.
+    return max(progress, 0)
+
+
+def next_poll_delay(playback: dict | None, interval: float) -> float:
+    """Return how long the poller may wait before fetching again.
+
+    While a track plays the next fetch is pulled forward to just after its
+    expected end, so track changes still show up promptly.
+    """
+
+    if not playback or not playback.get("is_playing"):
+        return interval
+    remaining_ms = playback_duration(playback) - (playback.get("progress_ms") or 0)
+    return min(interval, max(remaining_ms / 1000 + 0.25, 0.5))
+
+
+def poll_playback(interval: float = PLAYBACK_POLL_INTERVAL) -> None:
+    """Fetch Spotify playback state forever so the UI loop never blocks on it."""
+
+    while True:
+        slow_ms = float(os.getenv("RADIOFREE_SLOW_LOG_MS", "750") or 750)
+        try:
+            with log_if_slow(
+                logger, "spotify_controller.current_playback()", slow_ms
+            ):
+                playback = spotify_controller.current_playback(max_age=0)
+        except (ReadTimeout, RequestException) as e:
+            notify(f"Spotify API error: {e}", style="red")
+            delay = interval
+        else:
+            publish_playback(playback)
+            delay = next_poll_delay(playback, interval)
+        playback_poll_now.wait(delay)
+        playback_poll_now.clear()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -235,27 +456,97 @@ def log_song_history(
 # ─────────────────────────────────────────────────────────────
 
 
+# Queued tracks listed in the queue panel.
+QUEUE_PREVIEW_DEPTH = 5
+
+
+def queue_preview() -> tuple[tuple[str, str], ...]:
+    """Return ``(track, artist)`` for the first few queued tracks.
+
+    The head is copied with ``islice`` in one C-level step before any Python
+    code touches it, so an append from another thread can't mutate the deque
+    mid-iteration (which a generator over ``upnext.queue`` would hit).
+    """
+
+    head = tuple(islice(upnext.queue, QUEUE_PREVIEW_DEPTH))
+    return tuple(
+        (track.get("track_name", "Unknown"), track.get("artist_name", "Unknown"))
+        for track in head
+    )
+
+
 def render_queue_status() -> Text:
+    return _queue_status_text(upnext.mode, len(upnext.queue), queue_preview())
+
+
+@lru_cache(maxsize=8)
+def _queue_status_text(
+    mode: str, count: int, head: tuple[tuple[str, str], ...]
+) -> Text:
+    """Build the queue panel text; cached because the queue rarely changes."""
+
     queue_status = Text.from_markup(
-        f"[bold]Mode:[/bold] {upnext.mode}\n"
-        f"[bold]Queued Songs:[/bold] {len(upnext.queue)}\n"
+        f"[bold]Mode:[/bold] {mode}\n[bold]Queued Songs:[/bold] {count}\n"
     )
-    if upnext.queue:
-        for i, track in enumerate(upnext.queue[:5], start=1):
-            t_name = track.get("track_name", "Unknown")
-            a_name = track.get("artist_name", "Unknown")
+    if head:
+        for i, (t_name, a_name) in enumerate(head, start=1):
             queue_status.append(Text.from_markup(f"{i}. {t_name} - {a_name}\n"))
     else:
         queue_status.append(Text.from_markup("[dim]No songs queued.[/dim]"))
     return queue_status
 
 
-def render_progress_bar(progress_ms, duration_ms):
-    percent = min(progress_ms / duration_ms, 1.0) if duration_ms else 0
-    bar_length = 30
-    filled = int(bar_length * percent)
-    empty = bar_length - filled
-    bar = f"[cyan][{'█' * filled}{'░' * empty}][/cyan]"
+_LYRIC_HIGHLIGHT = Style(bold=True, italic=True, color="yellow")
+
+
+def _append_lyric_lines(
+    panel_text: Text,
+    lines: list[str],
+    start: int,
+    stop: int,
+    highlight: int,
+    prefix: str,
+    highlight_prefix: str,
+) -> None:
+    """Append ``lines[start:stop]`` to ``panel_text`` emphasising ``highlight``.
+
+    Runs of plain lines are joined into a single append so Rich tracks one
+    span per run instead of one per lyric line.
+    """
+
+    stop = min(stop, len(lines))
+    split = min(max(highlight, start), stop)
+    if split > start:
+        panel_text.append("".join(f"{prefix} {line}\n" for line in lines[start:split]))
+    if start <= highlight < stop:
+        panel_text.append(
+            f"{highlight_prefix} {lines[highlight]}\n", style=_LYRIC_HIGHLIGHT
+        )
+        split = highlight + 1
+    if stop > split:
+        panel_text.append("".join(f"{prefix} {line}\n" for line in lines[split:stop]))
+
+
+PROGRESS_BAR_LENGTH = 30
+# Every possible bar, indexed by the number of filled cells.
+_PROGRESS_BARS = tuple(
+    f"[cyan][{'█' * filled}{'░' * (PROGRESS_BAR_LENGTH - filled)}][/cyan]"
+    for filled in range(PROGRESS_BAR_LENGTH + 1)
+)
+
+
+def format_ms(ms: int) -> str:
+    """Return ``ms`` as ``MM:SS`` (minutes keep counting past an hour)."""
+
+    minutes, seconds = divmod(ms // 1000, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def render_progress_bar(progress_ms: int, duration_ms: int) -> str:
+    """Return the markup progress bar followed by the integer percentage."""
+
+    percent = max(0.0, min(progress_ms / duration_ms, 1.0)) if duration_ms > 0 else 0
+    bar = _PROGRESS_BARS[int(PROGRESS_BAR_LENGTH * percent)]
     return f"{bar} {int(percent * 100)}%"
 
 
@@ -281,6 +572,13 @@ def scroll_gpt_log(direction: int) -> None:
     )
 
 
+@lru_cache(maxsize=16)
+def _gpt_response_text(response: str) -> Text:
+    """Parse a GPT response's markup once; the result is only read from."""
+
+    return Text.from_markup(response, style="cyan")
+
+
 def render_gpt_log() -> Text:
     """Return the GPT response at the current scroll position."""
 
@@ -296,7 +594,7 @@ def render_gpt_log() -> Text:
 
         # Parse markup tags in the GPT response so styling is applied while
         # keeping prompts readable in a dimmer style for context.
-        panel_text.append_text(Text.from_markup(response, style="cyan"))
+        panel_text.append_text(_gpt_response_text(response))
         if gpt_log_scroll:
             panel_text.append(
                 f"\n\n[dim]↑ {gpt_log_scroll} page(s) from latest response[/dim]"
@@ -317,10 +615,9 @@ def gpt_log_controls_text() -> Text:
     return controls
 
 
-def render_keybinds_text() -> Text:
-    """Return a formatted list of available keyboard shortcuts."""
+def _build_keybinds_text(mode_label: str) -> Text:
+    """Return the keybind list for the given queue mode label."""
 
-    mode_label = "Playlist" if upnext.mode == "playlist" else "Smart"
     menu = [
         "[bold]1.[/bold] 󰼛 Tune in to RadioFree󰲿 with DJ gpt-4o-mini 󱚣 ",
         "[bold]2.[/bold] Queue 1 recommended song",
@@ -342,11 +639,25 @@ def render_keybinds_text() -> Text:
         "[bold]?[/bold] Toggle keybind panel",
         "[bold]0.[/bold] Quit",
     ]
-    if command_log_buffer:
-        menu.append(f"\n[bold]Last:[/bold] {command_log_buffer[-1]}")
     return Text.from_markup("\n".join(menu))
 
 
+# Parsed once per queue mode; only the "Last" line changes between frames.
+_KEYBINDS_TEXT = {label: _build_keybinds_text(label) for label in ("Playlist", "Smart")}
+
+
+def render_keybinds_text() -> Text:
+    """Return a formatted list of available keyboard shortcuts."""
+
+    mode_label = "Playlist" if upnext.mode == "playlist" else "Smart"
+    text = _KEYBINDS_TEXT[mode_label].copy()
+    if command_log_buffer:
+        text.append("\n\n")
+        text.append("Last:", style="bold")
+        text.append(f" {command_log_buffer[-1]}")
+    return text
+
+
 def render_status() -> Text:
     """Return a summary of current runtime status."""
 
@@ -355,13 +666,17 @@ def render_status() -> Text:
         mystery_state = "awaiting choice"
     else:
         mystery_state = "on" if mystery_manager.enabled else "off"
-    text = Text.from_markup(
-        f"[bold]GPT:[/bold] {gpt_dj.active_model}\n"
-        f"[bold]Mode:[/bold] {upnext.mode}\n"
+    return _status_text(gpt_dj.active_model, upnext.mode, auto_dj, mystery_state)
+
+
+@lru_cache(maxsize=8)
+def _status_text(model: str, mode: str, auto_dj: str, mystery_state: str) -> Text:
+    return Text.from_markup(
+        f"[bold]GPT:[/bold] {model}\n"
+        f"[bold]Mode:[/bold] {mode}\n"
         f"[bold]Auto-DJ:[/bold] {auto_dj}\n"
         f"[bold]Mystery:[/bold] {mystery_state}"
     )
-    return text
 
 
 def get_next_queued_track() -> tuple[str | None, str | None]:
@@ -388,45 +703,146 @@ def get_next_queued_track() -> tuple[str | None, str | None]:
     return None, None
 
 
-def create_layout(song_name: str, artist_name: str, playback: dict | None = None) -> Layout:
-    """Build and return the Rich layout for the main UI."""
+# (notifications shown, joined subtitle) from the last render.
+_notification_cache: tuple[tuple[Text, ...], str] = ((), "")
+
+
+def _notification_subtitle() -> str:
+    """Return the header subtitle, rejoining only when notifications change."""
+
+    global _notification_cache
+    # Copy first: background threads may notify() while we render.
+    current = tuple(notifications)
+    if current != _notification_cache[0]:
+        _notification_cache = (current, "\n".join(n.plain for n in current))
+    return _notification_cache[1]
+
+
+def ui_state(song_name: str, artist_name: str, playback: dict) -> tuple:
+    """Return a snapshot of everything :func:`create_layout` draws.
 
-    layout = Layout()
-    layout.split(
-        Layout(name="header", size=3),
-        Layout(name="lyrics", ratio=2),
-        Layout(name="lower", ratio=3),
+    The main loop compares successive snapshots and skips rebuilding the
+    panels when nothing visible has changed.
+    """
+
+    return (
+        song_name,
+        artist_name,
+        playback.get("progress_ms", 0) // 1000,
+        playback_duration(playback),
+        tuple(notifications),
+        lyrics_manager.ready,
+        lyrics_manager.lines,
+        lyrics_manager.current_index,
+        lyrics_view_mode,
+        lyrics_cursor,
+        show_keybinds,
+        show_gpt_log,
+        gpt_log_scroll,
+        len(gpt_log_buffer),
+        gpt_log_buffer[-1] if gpt_log_buffer else None,
+        command_log_buffer[-1] if command_log_buffer else None,
+        upnext.mode,
+        upnext.auto_dj_enabled,
+        len(upnext.queue),
+        queue_preview(),
+        mystery_manager.enabled,
+        mystery_manager.awaiting_choice,
+        gpt_dj.active_model,
     )
-    layout["lower"].split_row(
-        Layout(name="menu", ratio=1),
-        Layout(name="gpt", ratio=2),
-        Layout(name="queue", ratio=1),
+
+
+def _lyrics_viewport_rows() -> int:
+    """Return how many lyric lines fit inside the lyrics panel."""
+
+    # Header is 3 rows; lyrics get 2/5 of the rest, minus the panel border.
+    return max(1, (console.size.height - 3) * 2 // 5 - 2)
+
+
+_layout: Layout | None = None
+_panels: dict[str, Panel] = {}
+
+
+def _get_layout() -> Layout:
+    """Return the UI layout tree, building it and its panels on first use.
+
+    The region tree and panel frames never change between frames, so
+    :func:`create_layout` only swaps panel contents on the cached objects.
+    """
+
+    global _layout
+    if _layout is None:
+        layout = Layout()
+        layout.split(
+            Layout(name="header", size=3),
+            Layout(name="lyrics", ratio=2),
+            Layout(name="lower", ratio=3),
+        )
+        layout["lower"].split_row(
+            Layout(name="menu", ratio=1),
+            Layout(name="gpt", ratio=2),
+            Layout(name="queue", ratio=1),
+        )
+        _panels.update(
+            header=Panel("", subtitle_align="right"),
+            lyrics=Panel("", title="󰎆 Lyrics", border_style="cyan"),
+            menu=Panel("", border_style="green"),
+            gpt=Panel(
+                "",
+                title=" RadioFree󰲿",
+                border_style="magenta",
+                subtitle=gpt_log_controls_text(),
+                subtitle_align="right",
+            ),
+            queue=Panel("", title="  Coming Up Next", border_style="blue"),
+        )
+        for name, panel in _panels.items():
+            layout[name].update(panel)
+        _layout = layout
+    return _layout
+
+
+@lru_cache(maxsize=4)
+def _now_playing_text(song_name: str, artist_name: str) -> Text:
+    """Build the header's track line once per track.
+
+    Titles are inserted as plain text, so brackets in a song name are shown
+    verbatim instead of being lexed (or rejected) as markup on every frame.
+    """
+
+    return Text.assemble(
+        ("  Now Playing:", "bold green"),
+        " ",
+        (song_name, "yellow"),
+        " by ",
+        (artist_name, "cyan"),
     )
 
+
+def create_layout(song_name: str, artist_name: str, playback: dict | None = None) -> Layout:
+    """Refresh the panels of the cached Rich layout and return it."""
+
+    layout = _get_layout()
+
     # Queue panel
-    layout["queue"].update(
-        Panel(render_queue_status(), title="  Coming Up Next", border_style="blue")
-    )
+    _panels["queue"].renderable = render_queue_status()
 
     # Header panel
-    playback_data = playback or {}
-    progress = playback_data.get("progress_ms", 0)
-    duration = playback_data.get("item", {}).get("duration_ms", 0)
-    elapsed = time.strftime("%M:%S", time.gmtime(progress // 1000))
-    total = time.strftime("%M:%S", time.gmtime(duration // 1000))
+    progress = (playback or {}).get("progress_ms", 0)
+    duration = playback_duration(playback)
+    elapsed = format_ms(progress)
+    total = format_ms(duration)
     progress_bar = render_progress_bar(progress, duration)
-    subtitle = "\n".join(n.plain for n in notifications[-3:])
-    layout["header"].update(
-        Panel(
-            f"[bold green]  Now Playing:[/bold green] [yellow]{song_name}[/yellow] by [cyan]{artist_name}[/cyan]  [dim]| {elapsed} / {total}[/dim]",
-            title=f"RadioFreeDJ {progress_bar}",
-            subtitle=subtitle,
-            subtitle_align="right",
-        )
+    subtitle = _notification_subtitle()
+    header = _panels["header"]
+    header.renderable = Text.assemble(
+        _now_playing_text(song_name, artist_name),
+        (f"  | {elapsed} / {total}", "dim"),
     )
+    header.title = f"RadioFreeDJ {progress_bar}"
+    header.subtitle = subtitle
 
-    # Lyrics panel
-    lyrics_manager.sync(progress)
+    # Lyrics panel (the main loop has already synced to this progress)
     panel_text = Text()
     if not lyrics_manager.ready:
         panel_text.append("[dim]Loading lyrics...[/dim]")
@@ -434,39 +850,26 @@ def create_layout(song_name: str, artist_name: str, playback: dict | None = None
         lines, idx = lyrics_manager.lines, lyrics_manager.current_index
         if lyrics_view_mode == "chunk":
             start = max(0, idx - 3)
-            for i, line in enumerate(lines[start : start + 8], start):
-                prefix, style = (
-                    (
-                        "",
-                        "bold italic yellow",
-                    )
-                    if i == idx
-                    else ("-", None)
-                )
-                panel_text.append(f"{prefix} {line}\n", style=style)
+            _append_lyric_lines(
+                panel_text, lines, start, start + 8, idx, "-", ""
+            )
         else:
-            for i, line in enumerate(lines):
-                style = "bold italic yellow" if i == lyrics_cursor else None
-                panel_text.append(f"  {line}\n", style=style)
-    layout["lyrics"].update(Panel(panel_text, title="󰎆 Lyrics", border_style="cyan"))
+            # Only build the rows that fit the panel, centred on the cursor.
+            rows = _lyrics_viewport_rows()
+            start = max(0, min(lyrics_cursor - rows // 2, len(lines) - rows))
+            _append_lyric_lines(
+                panel_text, lines, start, start + rows, lyrics_cursor, " ", " "
+            )
+    _panels["lyrics"].renderable = panel_text
 
     # Status & GPT panels
     status_panel_title = "󰌪 Status" if not show_keybinds else "󰘴 Keybinds"
     status_panel_content = (
         render_status() if not show_keybinds else render_keybinds_text()
     )
-    layout["menu"].update(
-        Panel(status_panel_content, title=status_panel_title, border_style="green")
-    )
-    layout["gpt"].update(
-        Panel(
-            render_gpt_log(),
-            title=" RadioFree󰲿",
-            border_style="magenta",
-            subtitle=gpt_log_controls_text(),
-            subtitle_align="right",
-        )
-    )
+    _panels["menu"].title = status_panel_title
+    _panels["menu"].renderable = status_panel_content
+    _panels["gpt"].renderable = render_gpt_log()
 
     return layout
 
@@ -478,7 +881,7 @@ def recommend_next_song(song_name, artist_name):
     tpl = prompt_templates["recommend_next_song"]
     prompt = tpl.format(song_name=song_name, artist_name=artist_name)
     cancel_event.clear()
-    resp = gpt_dj.ask(prompt, cancel_event=cancel_event)
+    resp = gpt_dj.ask(prompt, cancel_event=cancel_event, bypass_cache=True)
     log_gpt(prompt, resp)
     if resp:
         console.print(
@@ -491,10 +894,10 @@ def create_playlist(song_name, artist_name):
     tpl = prompt_templates["create_playlist"]
     prompt = tpl.format(song_name=song_name, artist_name=artist_name)
     cancel_event.clear()
-    resp = gpt_dj.ask(prompt, cancel_event=cancel_event)
+    resp = gpt_dj.ask(prompt, cancel_event=cancel_event, bypass_cache=True)
     log_gpt(prompt, resp)
-    logger.info(f"[create_playlist] Prompt:\n{prompt}")
-    logger.info(f"[create_playlist] Response:\n{resp}")
+    logger.debug("[create_playlist] Prompt:\n%s", prompt)
+    logger.debug("[create_playlist] Response:\n%s", resp)
     if resp:
         console.print(Panel(resp, title="󰐑 FreeRadio Playlist", border_style="magenta"))
 
@@ -504,10 +907,10 @@ def theme_based_playlist():
     tpl = prompt_templates["theme_based_playlist"]
     prompt = tpl.format(theme=theme)
     cancel_event.clear()
-    resp = gpt_dj.ask(prompt, cancel_event=cancel_event)
+    resp = gpt_dj.ask(prompt, cancel_event=cancel_event, bypass_cache=True)
     log_gpt(prompt, resp)
-    logger.info(f"[theme_based_playlist] Prompt:\n{prompt}")
-    logger.info(f"[theme_based_playlist] Response:\n{resp}")
+    logger.debug("[theme_based_playlist] Prompt:\n%s", prompt)
+    logger.debug("[theme_based_playlist] Response:\n%s", resp)
     if resp:
         console.print(
             Panel(resp, title=f"󰐑 Themed Playlist: {theme}", border_style="magenta")
@@ -520,8 +923,8 @@ def generate_radio_intro(track_name, artist_name):
     cancel_event.clear()
     resp = gpt_dj.ask(prompt, cancel_event=cancel_event)
     log_gpt(prompt, resp)
-    logger.info(f"[generate_radio_intro] Prompt:\n{prompt}")
-    logger.info(f"[generate_radio_intro] Response:\n{resp}")
+    logger.debug("[generate_radio_intro] Prompt:\n%s", prompt)
+    logger.debug("[generate_radio_intro] Response:\n%s", resp)
     return resp or "󱚢 [DJ dead air] No intro available."
 
 
@@ -531,8 +934,8 @@ def song_insights(song_name, artist_name):
     cancel_event.clear()
     resp = gpt_dj.ask(prompt, cancel_event=cancel_event)
     log_gpt(prompt, resp)
-    logger.info(f"[song_insights] Prompt:\n{prompt}")
-    logger.info(f"[song_insights] Response:\n{resp}")
+    logger.debug("[song_insights] Prompt:\n%s", prompt)
+    logger.debug("[song_insights] Response:\n%s", resp)
     if resp:
         console.print(
             Panel(resp, title=" RadioFree DJ - gpt-4o-mini", border_style="cyan")
@@ -543,25 +946,98 @@ def song_insights(song_name, artist_name):
 # User Interaction Loop
 # ─────────────────────────────────────────────────────────────
 def read_input():
+    """Queue lines read from stdin on a thread (fallback for non-TTY stdin)."""
+
+    input_debug = os.getenv("RADIOFREE_INPUT_DEBUG", "").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "y",
+        "on",
+    }
+    # Print the prompt once; rendering it through Prompt.ask per keystroke
+    # contended with Live for the console lock.
+    console.print("[bold green]   Select an option[/bold green]", end=" ")
     try:
         while True:
-            input_debug = os.getenv("RADIOFREE_INPUT_DEBUG", "").strip().lower() in {
-                "1",
-                "true",
-                "yes",
-                "y",
-                "on",
-            }
             if input_debug:
-                logger.debug("read_input: waiting for Prompt.ask()")
-            choice = Prompt.ask("[bold green]   Select an option[/bold green]")
+                logger.debug("read_input: waiting for stdin")
+            line = sys.stdin.readline()
+            if not line:
+                return
+            choice = line.strip()
             if input_debug:
                 logger.debug("read_input: received choice=%r", choice)
-            user_input_queue.put(choice)
+            if choice:
+                user_input_queue.put(choice)
     except KeyboardInterrupt:
         pass
 
 
+def open_stdin_selector() -> selectors.BaseSelector | None:
+    """Return a selector watching stdin, or ``None`` when unsupported.
+
+    Selecting on stdin only works for POSIX terminals; everywhere else the
+    threaded :func:`read_input` loop is used instead.
+    """
+
+    if os.name != "posix" or not sys.stdin.isatty():
+        return None
+    selector = selectors.DefaultSelector()
+    try:
+        selector.register(sys.stdin, selectors.EVENT_READ)
+    except (OSError, ValueError):
+        selector.close()
+        return None
+    return selector
+
+
+# Bytes read from stdin that do not yet form a complete line.
+_stdin_partial = bytearray()
+
+
+def poll_stdin(selector: selectors.BaseSelector, timeout: float = 0) -> None:
+    """Queue every complete line on stdin, waiting at most ``timeout`` seconds.
+
+    The fd is read directly rather than through ``sys.stdin``: a buffered
+    ``readline`` would leave pasted extra lines in Python's buffer, where
+    ``select()`` cannot see them until the next keypress.
+    """
+
+    for key, _events in selector.select(timeout=timeout):
+        chunk = os.read(key.fd, 4096)
+        if not chunk:
+            # EOF (Ctrl+D): stop watching so select() doesn't spin.
+            selector.unregister(key.fileobj)
+            chunk = b"\n" if _stdin_partial else b""
+        _stdin_partial.extend(chunk)
+        *lines, rest = _stdin_partial.split(b"\n")
+        _stdin_partial[:] = rest
+        for line in lines:
+            choice = line.decode("utf-8", errors="replace").strip()
+            if choice:
+                user_input_queue.put(choice)
+
+
+def wait_for_input(
+    selector: selectors.BaseSelector | None, timeout: float
+) -> str | None:
+    """Return the next user command, blocking up to ``timeout`` seconds.
+
+    This is the main loop's only wait, so a keypress wakes it immediately
+    instead of being noticed on the next fixed tick.
+    """
+
+    if selector is not None:
+        if user_input_queue.empty():
+            poll_stdin(selector, timeout)
+        timeout = 0
+    try:
+        return user_input_queue.get(timeout=timeout)
+    except Empty:
+        return None
+
+
 def process_user_input(choice: str, current_song: str, current_artist: str):
     """Handle user commands and dispatch the appropriate action.
 
@@ -572,8 +1048,12 @@ def process_user_input(choice: str, current_song: str, current_artist: str):
     """
 
     slow_ms = float(os.getenv("RADIOFREE_SLOW_LOG_MS", "750") or 750)
-    with log_if_slow(logger, f"process_user_input(choice={choice!r})", slow_ms):
-        _process_user_input_inner(choice, current_song, current_artist)
+    try:
+        with log_if_slow(logger, f"process_user_input(choice={choice!r})", slow_ms):
+            _process_user_input_inner(choice, current_song, current_artist)
+    finally:
+        # Most commands can change playback; don't wait for the next poll.
+        playback_poll_now.set()
 
 
 def _process_user_input_inner(choice: str, current_song: str, current_artist: str) -> None:
@@ -588,18 +1068,14 @@ def _process_user_input_inner(choice: str, current_song: str, current_artist: st
         override_label = f"Mystery pick {choice}"
 
     label = log_command(choice, label_override=override_label)
-    command_log_buffer.append(f"{choice} → {label}")
-    if len(command_log_buffer) > 50:
-        command_log_buffer.pop(0)
+    command_log_buffer.append(describe_command(choice, override_label))
     notify(f"Command: {label}", style="green")
 
     global lyrics_view_mode, lyrics_cursor, show_gpt_log, show_keybinds
     choice_lower = choice.lower()
 
     if override_label:
-        success, message = mystery_manager.play_choice(int(choice))
-        style = "magenta" if success else "red"
-        notify(message, style=style)
+        run_control(play_mystery_choice, int(choice))
         return
 
     if choice == "?":
@@ -633,24 +1109,20 @@ def _process_user_input_inner(choice: str, current_song: str, current_artist: st
         state = "enabled" if upnext.auto_dj_enabled else "disabled"
         notify(f"Auto-DJ {state}", style="cyan")
         if upnext.auto_dj_enabled:
-            upnext.maintain_queue(current_song, current_artist)
-            if upnext.queue:
-                lyrics_manager.prefetch(
-                    upnext.queue[0]["track_name"],
-                    upnext.queue[0]["artist_name"],
-                )
+            schedule_auto_dj(current_song, current_artist)
     elif choice == "2":
-        upnext.queue_one_song(current_song, current_artist)
+        run_in_background(upnext.queue_one_song, current_song, current_artist)
     elif choice == "3":
-        upnext.queue_ten_songs(current_song, current_artist)
+        run_in_background(upnext.queue_ten_songs, current_song, current_artist)
     elif choice == "4":
-        upnext.queue_playlist(current_song, current_artist)
+        run_in_background(upnext.queue_playlist, current_song, current_artist)
     elif choice == "5":
-        upnext.queue_theme_playlist()
+        # Ask here (stdin belongs to this thread); the GPT call runs off it.
+        run_in_background(upnext.queue_theme_playlist, ask_theme())
     elif choice == "6":
-        upnext.song_insight(current_song, current_artist)
+        run_in_background(upnext.song_insight, current_song, current_artist)
     elif choice == "7":
-        upnext.explain_lyrics(current_song, current_artist)
+        run_in_background(upnext.explain_lyrics, current_song, current_artist)
     elif choice_lower == "m":
         enabled = mystery_manager.toggle()
         state = "enabled" if enabled else "disabled"
@@ -658,10 +1130,10 @@ def _process_user_input_inner(choice: str, current_song: str, current_artist: st
         if not enabled:
             notify("Numeric controls restored", style="magenta")
     elif choice == "b":
-        spotify_controller.restart_track()
+        run_control(spotify_controller.restart_track)
         notify("↩ Restarted track.", style="yellow")
     elif choice == "e":
-        spotify_controller.skip_to_end()
+        run_control(spotify_controller.skip_to_end)
         notify("⏭ Skipped to end of track.", style="yellow")
     elif choice == "t":
         upnext.toggle_playlist_mode()
@@ -676,23 +1148,17 @@ def _process_user_input_inner(choice: str, current_song: str, current_artist: st
         refresh_event.set()
         notify("Refreshing display", style="cyan")
     elif choice == "toggle_play":
-        playback = spotify_controller.sp.current_playback()
-        if playback and playback.get("is_playing"):
-            spotify_controller.pause()
-            notify("⏸ Paused playback", style="yellow")
-        else:
-            spotify_controller.resume()
-            notify("▶️ Resumed playback", style="yellow")
+        run_control(toggle_playback)
     elif choice == "next":
-        spotify_controller.next()
+        run_control(spotify_controller.next)
         notify("⏭ Skipped to next track.", style="yellow")
     elif choice == "prev":
-        spotify_controller.previous()
+        run_control(spotify_controller.previous)
         notify("⏮ Went back to previous track.", style="yellow")
     elif choice == "vol_up":
-        spotify_controller.change_volume(+10)
+        run_control(spotify_controller.change_volume, +10)
     elif choice == "vol_down":
-        spotify_controller.change_volume(-10)
+        run_control(spotify_controller.change_volume, -10)
     elif choice == "s":
         saved_path = os.path.expanduser("~/.radiofreedj/saved_songs.json")
         os.makedirs(os.path.dirname(saved_path), exist_ok=True)
@@ -703,13 +1169,13 @@ def _process_user_input_inner(choice: str, current_song: str, current_artist: st
         }
         try:
             if os.path.exists(saved_path):
-                with open(saved_path, "r") as f:
-                    data = json.load(f)
+                with open(saved_path, "rb") as f:
+                    data = json_utils.loads(f.read())
             else:
                 data = []
             data.append(song_data)
-            with open(saved_path, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(saved_path, "wb") as f:
+                f.write(json_utils.dumps(data, indent=True))
             notify(f"💾 Saved: {current_song} by {current_artist}", style="green")
         except Exception as e:
             notify(f"Error saving song: {e}", style="red")
@@ -742,24 +1208,47 @@ def fetch_playback_item(max_retries: int = 10, delay: float = 0.2) -> dict:
     item: dict = {}
     for _ in range(max_retries):
         try:
-            playback = spotify_controller.sp.current_playback()
-            item = playback.get("item", {}) if playback else {}
+            playback = spotify_controller.current_playback(max_age=0)
+            item = (playback.get("item") if playback else None) or {}
             if item.get("duration_ms", 0) >= 1000:
                 return item
         except (ReadTimeout, RequestException) as e:
-            logger.warning(f"Spotify API error: {e}")
+            logger.warning("Spotify API error: %s", e)
         time.sleep(delay)
-    logger.warning(f"Playback details unavailable after {max_retries} attempts")
+    logger.warning("Playback details unavailable after %d attempts", max_retries)
     return item
 
 
+def track_key(item: dict) -> str | None:
+    """Return a stable identifier for a playback item.
+
+    Local files have no Spotify ``id``, so their ``uri`` is used instead.
+    """
+
+    return item.get("id") or item.get("uri")
+
+
+def queued_uri(item: dict | None) -> str | None:
+    """Return the URI a playback item was requested by.
+
+    When Spotify relinks a track to a regional copy, ``linked_from`` holds the
+    URI that was originally queued.
+    """
+
+    if not item:
+        return None
+    return (item.get("linked_from") or {}).get("uri") or item.get("uri")
+
+
 def handle_track_change(
-    prev_song: dict, current_song: str, current_artist: str
+    prev_song: dict, current_song: str, current_artist: str, item: dict | None = None
 ) -> None:
     """Perform network-heavy tasks when the track changes.
 
-    This function runs in a background thread so the main UI loop stays
-    responsive when a new song starts playing.
+    This function runs on its own worker thread so the main UI loop stays
+    responsive when a new song starts playing, and so the lyrics reset is
+    never held up by a GPT request. Auto-DJ refills and DJ commentary are
+    handed on to the background worker.
 
     Parameters
     ----------
@@ -769,35 +1258,120 @@ def handle_track_change(
         Title of the new song.
     current_artist:
         Artist of the new song.
+    item:
+        Playback item already fetched by the caller. Spotify is only polled
+        again when it lacks a usable ``duration_ms``.
     """
 
-    item2 = fetch_playback_item()
-    duration_ms = item2.get("duration_ms", 0)
-    album_name = item2.get("album", {}).get("name", "")
+    if not item or item.get("duration_ms", 0) < 1000:
+        item = fetch_playback_item()
+    duration_ms, album_name = item_details(item)
 
     notify(f"🔄 Track changed: {current_song} by {current_artist}", style="cyan")
     lyrics_manager.start(current_song, current_artist, album_name, duration_ms)
+
+    # Last.fm calls block on the network, so they come after the lyrics reset.
+    if prev_song.get("name") and prev_song.get("artist"):
+        scrobble(prev_song["name"], prev_song["artist"], prev_song["started"])
     sync_with_lastfm(current_song, current_artist)
 
     global auto_dj_counter
     auto_dj_counter += 1
     if upnext.auto_dj_enabled:
-        upnext.maintain_queue(current_song, current_artist)
-        if auto_dj_counter % 3 == 0 and upnext.queue:
-            upnext.dj_commentary(
-                (prev_song.get("name"), prev_song.get("artist")),
-                (
-                    upnext.queue[0]["track_name"],
-                    upnext.queue[0]["artist_name"],
-                ),
+        schedule_auto_dj(current_song, current_artist, queued_uri(item))
+        if auto_dj_counter % 3 == 0:
+            run_in_background(
+                announce_next_track, (prev_song.get("name"), prev_song.get("artist"))
+            )
+
+
+def announce_next_track(prev_track: tuple[str | None, str | None]) -> None:
+    """Have the DJ bridge from ``prev_track`` to the next queued track."""
+
+    next_track = get_next_queued_track()
+    if next_track[0] and next_track[1]:
+        upnext.dj_commentary(prev_track, next_track)
+
+
+# Queued tracks whose lyrics are fetched ahead of a skip or auto-advance.
+LYRICS_PREFETCH_DEPTH = 3
+
+
+def fill_track_details(items: list[dict]) -> None:
+    """Add ``duration_ms``/``album_name`` to queue items in one bulk request.
+
+    lrclib needs the duration to match a track; items already filled in (or
+    lacking a URI) are skipped, so repeat calls cost nothing.
+    """
+
+    missing = [t for t in items if t.get("uri") and "duration_ms" not in t]
+    if not missing:
+        return
+    tracks = spotify_controller.bulk_tracks([t["uri"] for t in missing])
+    for item, track in zip(missing, tracks):
+        item["duration_ms"], item["album_name"] = (
+            item_details(track) if track else (0, "")
+        )
+
+
+def maintain_auto_dj(
+    current_song: str, current_artist: str, current_uri: str | None = None
+) -> None:
+    """Top up the Auto-DJ queue and prefetch lyrics for the next few tracks."""
+
+    try:
+        upnext.maintain_queue(current_song, current_artist, current_uri)
+        upcoming = list(islice(upnext.queue, LYRICS_PREFETCH_DEPTH))
+        fill_track_details(upcoming)
+        lyrics_manager.prefetch_upcoming(
+            (
+                t.get("track_name"),
+                t.get("artist_name"),
+                t.get("album_name", ""),
+                t.get("duration_ms", 0),
             )
+            for t in upcoming
+        )
+    finally:
+        auto_dj_pending.clear()
+
+
+def schedule_auto_dj(
+    current_song: str, current_artist: str, current_uri: str | None = None
+) -> None:
+    """Queue Auto-DJ maintenance unless a previous run is still pending."""
+
+    if auto_dj_pending.is_set():
+        return
+    auto_dj_pending.set()
+    run_in_background(maintain_auto_dj, current_song, current_artist, current_uri)
 
 
 def main():
     global last_song, show_lyrics, show_gpt_log, lyrics_view_mode, lyrics_cursor
     try:
         start_freeze_watchdog(logger, HEARTBEAT)
-        threading.Thread(target=read_input, daemon=True).start()
+        threading.Thread(
+            target=background_worker, name="radiofree-bg", daemon=True
+        ).start()
+        threading.Thread(
+            target=background_worker,
+            args=(control_tasks, playback_poll_now.set),
+            name="radiofree-controls",
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=background_worker,
+            args=(track_change_tasks,),
+            name="radiofree-tracks",
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=poll_playback, name="radiofree-poller", daemon=True
+        ).start()
+        stdin_selector = open_stdin_selector()
+        if stdin_selector is None:
+            threading.Thread(target=read_input, daemon=True).start()
         console.print("[green]🚀 Starting FreeRadioDJ...[/green]\n")
         song_name, artist_name = spotify_controller.get_current_song()
         while not song_name:
@@ -806,10 +1380,13 @@ def main():
             )
             time.sleep(3)
             song_name, artist_name = spotify_controller.get_current_song()
-        item = fetch_playback_item()
-        duration_ms = item.get("duration_ms", 0)
-        album_name = item.get("album", {}).get("name", "")
+        # get_current_song just fetched this snapshot, so this is usually free.
+        item = (spotify_controller.current_playback() or {}).get("item") or {}
+        if item.get("duration_ms", 0) < 1000:
+            item = fetch_playback_item()
+        duration_ms, album_name = item_details(item)
         last_song = {
+            "id": track_key(item),
             "name": song_name,
             "artist": artist_name,
             "started": int(time.time()),
@@ -819,91 +1396,63 @@ def main():
         console.print(
             "[dim]Press [?] for help. Use [bold]l[/bold] to toggle lyrics and [bold]g[/bold] for GPT log.[/dim]"
         )
-        # Increase refresh rate to improve UI responsiveness
-        # CPU overhead measured <0.1s over 3 seconds at 10 FPS (see docs).
-        with Live(refresh_per_second=10, screen=True) as live:
+        # Redraws are driven by the loop below: the terminal is only written
+        # when ui_state() changes or a refresh is requested.
+        fetched_at, polled = 0.0, None
+        last_ui_state = None
+        with Live(auto_refresh=False, screen=True) as live:
             while True:
+                HEARTBEAT.beat("playback.wait")
                 try:
-                    HEARTBEAT.beat("spotify.current_playback")
-                    slow_ms = float(os.getenv("RADIOFREE_SLOW_LOG_MS", "750") or 750)
-                    with log_if_slow(
-                        logger,
-                        "spotify_controller.sp.current_playback()",
-                        slow_ms,
-                    ):
-                        playback = spotify_controller.sp.current_playback()
-                except (ReadTimeout, RequestException) as e:
-                    notify(f"Spotify API error: {e}", style="red")
-                    continue
-                if not playback or not playback.get("item"):
-                    time.sleep(1)
+                    fetched_at, polled = playback_snapshots.get_nowait()
+                except Empty:
+                    # Keep drawing the last snapshot between polls.
+                    pass
+                if not polled or not polled.get("item"):
+                    try:
+                        fetched_at, polled = playback_snapshots.get(timeout=1.0)
+                    except Empty:
+                        pass
                     continue
+                progress_ms = interpolate_progress(polled, fetched_at)
+                playback = dict(polled, progress_ms=progress_ms)
                 item = playback["item"]
                 current_song = item["name"]
                 current_artist = item["artists"][0]["name"]
-                progress_ms = playback.get("progress_ms", 0)
-                if (current_song, current_artist) != (
-                    last_song["name"],
-                    last_song["artist"],
-                ):
+                track_id = track_key(item)
+                if track_id != last_song["id"]:
                     prev_song = last_song.copy()
-                    if prev_song["name"] and prev_song["artist"]:
-                        scrobble(
-                            prev_song["name"], prev_song["artist"], prev_song["started"]
-                        )
                     last_song = {
+                        "id": track_id,
                         "name": current_song,
                         "artist": current_artist,
                         "started": int(time.time()),
                     }
-                    item2 = fetch_playback_item()
-                    duration_ms = item2.get("duration_ms", 0)
-                    album_name = item2.get("album", {}).get("name", "")
-                    notify(
-                        f"🔄 Track changed: {current_song} by {current_artist}",
-                        style="cyan",
-                    )
-                    lyrics_manager.start(
-                        current_song, current_artist, album_name, duration_ms
-                    )
-                    sync_with_lastfm(current_song, current_artist)
-                    global auto_dj_counter
-                    auto_dj_counter += 1
-                    if upnext.auto_dj_enabled:
-                        upnext.maintain_queue(current_song, current_artist)
-                        if auto_dj_counter % 3 == 0:
-                            next_track = get_next_queued_track()
-                            if next_track[0] and next_track[1]:
-                                upnext.dj_commentary(
-                                    (last_song["name"], last_song["artist"]),
-                                    next_track,
-                                )
+                    run_track_change(prev_song, current_song, current_artist, item)
 
                 lyrics_manager.sync(progress_ms)
                 if upnext.auto_dj_enabled:
-                    upnext.maintain_queue(current_song, current_artist)
-                    if upnext.queue:
-                        lyrics_manager.prefetch(
-                            upnext.queue[0]["track_name"],
-                            upnext.queue[0]["artist_name"],
+                    schedule_auto_dj(current_song, current_artist, queued_uri(item))
+                state = ui_state(current_song, current_artist, playback)
+                if state != last_ui_state or refresh_event.is_set():
+                    last_ui_state = state
+                    HEARTBEAT.beat("render.create_layout")
+                    slow_ms = float(os.getenv("RADIOFREE_SLOW_LOG_MS", "750") or 750)
+                    with log_if_slow(logger, "create_layout()", slow_ms):
+                        layout = create_layout(
+                            current_song, current_artist, playback=playback
                         )
-                HEARTBEAT.beat("render.create_layout")
-                slow_ms = float(os.getenv("RADIOFREE_SLOW_LOG_MS", "750") or 750)
-                with log_if_slow(logger, "create_layout()", slow_ms):
-                    layout = create_layout(current_song, current_artist, playback=playback)
-                HEARTBEAT.beat("render.live.update")
-                with log_if_slow(logger, "live.update()", slow_ms):
-                    live.update(layout)
-                HEARTBEAT.beat("render.done")
-                if refresh_event.is_set():
-                    live.refresh()
-                    refresh_event.clear()
-                if not user_input_queue.empty():
-                    choice = user_input_queue.get()
+                    HEARTBEAT.beat("render.live.update")
+                    with log_if_slow(logger, "live.update()", slow_ms):
+                        live.update(layout, refresh=True)
+                    HEARTBEAT.beat("render.done")
+                refresh_event.clear()
+                HEARTBEAT.beat("input.wait")
+                choice = wait_for_input(stdin_selector, timeout=0.5)
+                if choice is not None:
                     HEARTBEAT.beat(f"input.process({choice!r})")
                     process_user_input(choice, current_song, current_artist)
                     HEARTBEAT.beat("input.processed")
-                time.sleep(0.5)
     except KeyboardInterrupt:
         console.print("\n[bold red]⏹ Exiting FreeRadioDJ... Goodbye![/bold red]")
     except Exception as e:
@@ -9,10 +9,13 @@ options as well as locking in a listener's manual choice.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any, Iterable
 
+from rich.markup import escape
+
+import json_utils
+
 
 @dataclass(slots=True)
 class MysteryTrack:
@@ -90,15 +93,17 @@ class MysteryModeManager:
         )
         if cancel_event is not None:
             cancel_event.clear()
-        response = self.dj.ask(prompt, cancel_event=cancel_event)
+        response = self.dj.ask(
+            prompt, cancel_event=cancel_event, bypass_cache=True
+        )
         if not response:
             self.dj.logger.warning("Mystery mode: no response from GPT")
             self.clear_choices()
             return None
 
         try:
-            parsed = json.loads(response)
-        except json.JSONDecodeError as exc:
+            parsed = json_utils.loads(response)
+        except json_utils.JSONDecodeError as exc:
             self.dj.logger.error("Mystery mode JSON parse error: %s", exc)
             self.clear_choices()
             return None
@@ -110,14 +115,16 @@ class MysteryModeManager:
             self.clear_choices()
             return None
 
-        self._choices = []
-        for option in options[:5]:
-            name = option.get("track_name")
-            artist = option.get("artist_name")
-            if not name or not artist:
-                continue
-            uri = self.sp.search_track(name, artist)
-            self._choices.append(MysteryTrack(name, artist, uri))
+        pairs = [
+            (option.get("track_name"), option.get("artist_name"))
+            for option in options[:5]
+        ]
+        pairs = [(name, artist) for name, artist in pairs if name and artist]
+        uris = self.sp.search_tracks(pairs)
+        self._choices = [
+            MysteryTrack(name, artist, uri)
+            for (name, artist), uri in zip(pairs, uris)
+        ]
 
         if not self._choices:
             self.dj.logger.warning("Mystery mode: no playable Spotify tracks")
@@ -185,11 +192,11 @@ class MysteryModeManager:
         """Return Rich markup summarising GPT's options without spoilers."""
 
         lines = ["[bold]Mystery Crate Picks[/bold]"]
-        for idx, track in enumerate(self._choices, start=1):
-            availability = "" if track.uri else " [dim](unavailable)[/dim]"
-            lines.append(
-                f"{idx}. {track.track_name} — {track.artist_name}{availability}"
-            )
+        lines.extend(
+            f"{idx}. {escape(track.track_name)} — {escape(track.artist_name)}"
+            + ("" if track.uri else " [dim](unavailable)[/dim]")
+            for idx, track in enumerate(self._choices, start=1)
+        )
         lines.append("")
         lines.append("[dim]Press 1-5 to choose the next track.[/dim]")
         return "\n".join(lines)
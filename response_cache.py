@@ -0,0 +1,123 @@
+"""Persistent exact-match cache for GPT responses and fetched lyrics.
+
+:class:`ResponseCache` maps a hash of everything that determines a model's
+answer (model name, system prompt and user prompt) to the response text. The
+entries live in a small JSON file so repeated questions about the same track
+are answered instantly across sessions. The lyrics manager reuses it to keep
+raw LRC documents keyed by artist and title.
+
+Writes are coalesced: :meth:`ResponseCache.put` only marks the cache dirty and
+a short timer thread rewrites the file, so bursts of entries (a batch of
+track lookups, rapid skips) cost one write and callers never wait on disk.
+Pending entries are flushed at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import json_utils
+from logger_utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ResponseCache:
+    """Least-recently-used mapping of prompt hashes to responses."""
+
+    # Seconds to wait after the first unsaved ``put`` before writing.
+    SAVE_DELAY = 1.0
+
+    def __init__(self, path: str | None, max_entries: int = 500) -> None:
+        """Create a cache persisted at ``path`` (in memory only when ``None``)."""
+
+        self.path = os.path.expanduser(path) if path else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+        if self.path:
+            atexit.register(self.flush)
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Return a stable hash for the given prompt components."""
+
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update((part or "").encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key`` or ``None``."""
+
+        with self._lock:
+            self._load()
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store ``response`` under ``key`` and schedule a write to disk."""
+
+        with self._lock:
+            self._load()
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if not self.path:
+                return
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending entries to disk now."""
+
+        with self._write_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                data = json_utils.dumps(self._entries)
+            self._save(data)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                data = json_utils.loads(f.read())
+            self._entries.update(
+                (k, v) for k, v in data.items() if isinstance(v, str)
+            )
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable cache %s: %s", self.path, e)
+
+    def _save(self, data: bytes) -> None:
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write cache %s: %s", self.path, e)
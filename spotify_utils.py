@@ -4,6 +4,10 @@ This module exposes :class:`SpotifyController`, a thin wrapper that provides
 methods for playing tracks, adjusting volume and managing the playback queue.
 """
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from dotenv import load_dotenv
@@ -11,15 +15,59 @@ except ModuleNotFoundError:  # pragma: no cover
     def load_dotenv(*_args, **_kwargs):
         return False
 from logger_utils import setup_logger
+from response_cache import ResponseCache
 
 # Load environment variables
 load_dotenv()
 
+DEFAULT_URI_CACHE_PATH = "~/RadioFree/cache/track_uris.json"
+
+SPOTIFY_SCOPE = " ".join(
+    [
+        "user-read-playback-state",
+        "user-modify-playback-state",
+        "user-read-currently-playing",
+        "user-read-private",
+        "user-library-read",
+    ]
+)
+
 
 class SpotifyController:
     """Wrapper around Spotipy exposing common playback controls."""
-    def __init__(self):
+
+    # Seconds a ``current_playback`` snapshot may be reused by other callers.
+    # The main loop polls every ~0.5s, so this lets commands and helpers
+    # share the loop's fetch instead of issuing their own roundtrip.
+    PLAYBACK_TTL = 0.4
+
+    # Search results keyed by case-folded (track, artist). Misses are kept
+    # briefly so GPT re-suggesting an unknown track doesn't re-query at once.
+    SEARCH_CACHE_SIZE = 1024
+    SEARCH_MISS_TTL = 300.0
+    # Upper bound on concurrent searches issued by ``search_tracks``.
+    SEARCH_CONCURRENCY = 4
+
+    # Seconds the device used by ``play_track`` is reused without asking
+    # Spotify again.
+    DEVICE_TTL = 30.0
+
+    def __init__(self, uri_cache_path=None):
         self.logger = setup_logger(self.__class__.__name__)
+        # (monotonic fetch time, playback) shared through ``current_playback``
+        self._playback: tuple[float, dict | None] = (float("-inf"), None)
+        # (monotonic lookup time, device id); dropped when a play fails so a
+        # stale id (device went offline) is looked up again next time.
+        self._device: tuple[float, str | None] = (float("-inf"), None)
+        self._search_cache: OrderedDict[
+            tuple[str, str], tuple[float, str | None]
+        ] = OrderedDict()
+        self._search_lock = threading.Lock()
+        # Found URIs also persist on disk so restarts don't repeat known lookups.
+        self.uri_store = ResponseCache(
+            uri_cache_path or os.getenv("RADIOFREE_URI_CACHE", DEFAULT_URI_CACHE_PATH),
+            max_entries=self.SEARCH_CACHE_SIZE * 4,
+        )
         try:
             import spotipy  # type: ignore[import-not-found]
             from spotipy.oauth2 import SpotifyOAuth  # type: ignore[import-not-found]
@@ -31,22 +79,37 @@ class SpotifyController:
 
         self.sp = spotipy.Spotify(
             auth_manager=SpotifyOAuth(
-                scope=(
-                    "user-read-playback-state "
-                    "user-modify-playback-state "
-                    "user-read-currently-playing "
-                    "user-read-private "
-                    "user-library-read"
-                ),
+                scope=SPOTIFY_SCOPE,
                 client_id=os.getenv("SPOTIPY_CLIENT_ID"),
                 client_secret=os.getenv("SPOTIPY_CLIENT_SECRET"),
                 redirect_uri=os.getenv("SPOTIPY_REDIRECT_URI"),
             )
         )
 
+    def current_playback(self, max_age: float | None = None) -> dict | None:
+        """Return the playback state, reusing a snapshot younger than ``max_age``.
+
+        ``max_age`` defaults to :attr:`PLAYBACK_TTL`; pass ``0`` to force a
+        fresh request. Errors propagate to the caller unchanged.
+        """
+
+        if max_age is None:
+            max_age = self.PLAYBACK_TTL
+        fetched_at, playback = self._playback
+        if max_age > 0 and time.monotonic() - fetched_at < max_age:
+            return playback
+        playback = self.sp.current_playback()
+        self._playback = (time.monotonic(), playback)
+        return playback
+
+    def invalidate_playback(self) -> None:
+        """Drop the cached playback snapshot after changing playback state."""
+
+        self._playback = (float("-inf"), None)
+
     def get_current_song(self):
         try:
-            current = self.sp.current_playback()
+            current = self.current_playback()
             if not current or not current.get("item"):
                 return None, None
             song_name = current["item"]["name"]
@@ -57,31 +120,117 @@ class SpotifyController:
             return None, None
 
     def search_track(self, track_name, artist_name):
+        """Return the URI of the best match, memoized per (track, artist).
+
+        Safe to call from several threads at once: only cache bookkeeping is
+        serialized, the Spotify request itself runs unlocked.
+        """
+        key = (str(track_name).casefold(), str(artist_name).casefold())
+        with self._search_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                stored_at, uri = cached
+                fresh = time.monotonic() - stored_at < self.SEARCH_MISS_TTL
+                if uri is not None or fresh:
+                    self._search_cache.move_to_end(key)
+                    return uri
+        store_key = ResponseCache.key(*key)
+        uri = self.uri_store.get(store_key)
+        if uri:
+            self._remember_search(key, uri)
+            return uri
         try:
             query = f"track:{track_name} artist:{artist_name}"
             result = self.sp.search(q=query, type="track", limit=1)
             tracks = result.get("tracks", {}).get("items", [])
-            return tracks[0]["uri"] if tracks else None
+            uri = tracks[0]["uri"] if tracks else None
         except Exception as e:
             self.logger.error("Error searching track: %s", e)
             return None
+        if uri:
+            self.uri_store.put(store_key, uri)
+        self._remember_search(key, uri)
+        return uri
+
+    def _remember_search(self, key, uri):
+        with self._search_lock:
+            self._search_cache[key] = (time.monotonic(), uri)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+    def device_id(self, max_age: float | None = None) -> str | None:
+        """Return the device to play on, avoiding a ``devices()`` call if possible.
+
+        The device of a recent playback snapshot is used first, then the id
+        remembered from the last lookup; only when both are older than
+        ``max_age`` (default :attr:`DEVICE_TTL`) is Spotify asked again.
+        """
+
+        if max_age is None:
+            max_age = self.DEVICE_TTL
+        now = time.monotonic()
+        fetched_at, playback = self._playback
+        device = (playback or {}).get("device") or {}
+        if device.get("id") and now - fetched_at < max_age:
+            return device["id"]
+        fetched_at, device_id = self._device
+        if device_id and now - fetched_at < max_age:
+            return device_id
+        devices = self.sp.devices().get("devices", [])
+        device_id = devices[0]["id"] if devices else None
+        self._device = (time.monotonic(), device_id)
+        return device_id
+
+    def search_tracks(self, pairs):
+        """Resolve ``(track, artist)`` pairs concurrently, preserving order."""
+
+        pairs = list(pairs)
+        if len(pairs) <= 1:
+            return [self.search_track(track, artist) for track, artist in pairs]
+        workers = min(len(pairs), self.SEARCH_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda pair: self.search_track(*pair), pairs))
+
+    def bulk_tracks(self, ids):
+        """Return track objects for ``ids`` (ids or URIs), 50 per request.
+
+        The result lines up with ``ids``; entries that could not be fetched
+        are ``None``.
+        """
+
+        ids = list(ids)
+        tracks = []
+        for start in range(0, len(ids), 50):
+            chunk = ids[start : start + 50]
+            try:
+                found = self.sp.tracks(chunk).get("tracks") or []
+            except Exception as e:
+                self.logger.error("Error fetching tracks: %s", e)
+                found = []
+            tracks.extend(found + [None] * (len(chunk) - len(found)))
+        return tracks
 
     def play_track(self, track_uri):
         try:
-            devices = self.sp.devices().get("devices", [])
-            if not devices:
+            device_id = self.device_id()
+            if not device_id:
                 self.logger.warning("No active Spotify device")
                 return
-            device_id = devices[0]["id"]
-            self.sp.transfer_playback(device_id, force_play=True)
-            self.sp.start_playback(uris=[track_uri])
+            # Targeting the device here transfers playback as part of the
+            # same request, so no separate transfer_playback round trip.
+            self.sp.start_playback(device_id=device_id, uris=[track_uri])
+            self.invalidate_playback()
         except Exception as e:
+            self._device = (float("-inf"), None)
+            self.invalidate_playback()
             self.logger.error("Error playing track: %s", e)
 
     def pause(self):
         """Pause the currently playing track."""
         try:
             self.sp.pause_playback()
+            self.invalidate_playback()
         except Exception as e:
             self.logger.error("Error pausing: %s", e)
 
@@ -89,6 +238,7 @@ class SpotifyController:
         """Resume playback on the active device."""
         try:
             self.sp.start_playback()
+            self.invalidate_playback()
         except Exception as e:
             self.logger.error("Error resuming: %s", e)
 
@@ -96,6 +246,7 @@ class SpotifyController:
         """Skip to the next track."""
         try:
             self.sp.next_track()
+            self.invalidate_playback()
         except Exception as e:
             self.logger.error("Error skipping: %s", e)
 
@@ -103,6 +254,7 @@ class SpotifyController:
         """Return to the previous track."""
         try:
             self.sp.previous_track()
+            self.invalidate_playback()
         except Exception as e:
             self.logger.error("Error going back: %s", e)
 
@@ -121,13 +273,16 @@ class SpotifyController:
 
     def change_volume(self, delta):
         try:
-            playback = self.sp.current_playback()
+            # Relative change: a snapshot from before the last press would
+            # make quick repeated presses compute from the same volume.
+            playback = self.current_playback(max_age=0)
             if not playback or "device" not in playback:
                 self.logger.warning("No active device")
                 return
             current_vol = playback["device"]["volume_percent"]
             new_vol = min(100, max(0, current_vol + delta))
             self.sp.volume(new_vol)
+            self.invalidate_playback()
             self.logger.info("Volume set to %d%%", new_vol)
         except Exception as e:
             self.logger.error("Error changing volume: %s", e)
@@ -136,16 +291,18 @@ class SpotifyController:
         """Restart playback from the beginning of the current track."""
         try:
             self.sp.seek_track(0)
+            self.invalidate_playback()
         except Exception as e:
             self.logger.error("Error restarting track: %s", e)
 
     def skip_to_end(self) -> None:
         """Seek to the final second of the current track to move to the next."""
         try:
-            playback = self.sp.current_playback()
+            playback = self.current_playback()
             duration = playback.get("item", {}).get("duration_ms", 0) if playback else 0
             if duration > 1000:
                 self.sp.seek_track(duration - 1000)
+                self.invalidate_playback()
             else:
                 self.next()
         except Exception as e:
@@ -0,0 +1,48 @@
+"""Test doubles shared by the manager tests."""
+
+
+class DummyLogger:
+    def debug(self, *args, **kwargs):
+        pass
+
+    def info(self, *args, **kwargs):
+        pass
+
+    def warning(self, *args, **kwargs):
+        pass
+
+    def error(self, *args, **kwargs):
+        pass
+
+
+class DummyDJ:
+    """GPT stand-in that returns a canned response and counts calls."""
+
+    def __init__(self, response: str = "{}"):
+        self.response = response
+        self.calls = 0
+        self.logger = DummyLogger()
+
+    def ask(self, prompt, cancel_event=None, bypass_cache=False):
+        self.calls += 1
+        return self.response
+
+
+class DummySpotify:
+    """Spotify stand-in that finds every track and records playback calls."""
+
+    def __init__(self):
+        self.queued: list[str] = []
+        self.played: list[str] = []
+
+    def search_track(self, track, artist):
+        return f"uri:{track}:{artist}"
+
+    def search_tracks(self, pairs):
+        return [self.search_track(track, artist) for track, artist in pairs]
+
+    def add_to_queue(self, uri):
+        self.queued.append(uri)
+
+    def play_track(self, uri):
+        self.played.append(uri)
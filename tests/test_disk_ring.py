@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from disk_ring import DiskRing, read_records
+
+
+class DiskRingTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "ring.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_append_wraps_and_keeps_newest(self):
+        ring = DiskRing(self.path, slots=3, slot_size=32)
+        for i in range(5):
+            ring.append(f"entry{i}".encode())
+
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.records(), [b"entry2", b"entry3", b"entry4"])
+        self.assertEqual(os.path.getsize(self.path), 12 + 3 * 32)
+        ring.close()
+
+    def test_records_survive_reopen(self):
+        ring = DiskRing(self.path, slots=4, slot_size=32)
+        ring.append(b"first")
+        ring.append(b"second")
+        ring.replace_last(b"patched")
+        ring.close()
+
+        reopened = DiskRing(self.path, slots=4, slot_size=32)
+        self.assertEqual(reopened.records(), [b"first", b"patched"])
+        self.assertEqual(reopened.last(), b"patched")
+        reopened.close()
+
+    def test_oversized_record_is_rejected(self):
+        ring = DiskRing(self.path, slots=2, slot_size=8)
+        ring.append(b"abcd")
+        with self.assertRaises(ValueError):
+            ring.append(b"abcdefgh")
+        with self.assertRaises(ValueError):
+            ring.replace_last(b"abcdefgh")
+        self.assertEqual(ring.records(), [b"abcd"])
+        ring.close()
+
+    def test_read_records_leaves_file_untouched(self):
+        ring = DiskRing(self.path, slots=3, slot_size=32)
+        for i in range(4):
+            ring.append(f"entry{i}".encode())
+        ring.close()
+
+        self.assertEqual(
+            read_records(self.path, slots=3, slot_size=32),
+            [b"entry1", b"entry2", b"entry3"],
+        )
+        with self.assertRaises(ValueError):
+            read_records(self.path, slots=4, slot_size=32)
+        reopened = DiskRing(self.path, slots=3, slot_size=32)
+        self.assertEqual(len(reopened), 3)
+        reopened.close()
+
+    def test_layout_change_resets_ring(self):
+        ring = DiskRing(self.path, slots=2, slot_size=16)
+        ring.append(b"old")
+        ring.close()
+
+        resized = DiskRing(self.path, slots=4, slot_size=16)
+        self.assertEqual(resized.records(), [])
+        resized.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
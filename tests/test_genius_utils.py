@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import genius_utils
+
+
+class GeniusUtilsTest(unittest.TestCase):
+    def setUp(self):
+        genius_utils._lyrics_cache.clear()
+        self.client = mock.MagicMock()
+        patcher = mock.patch.object(
+            genius_utils, "_get_genius_client", return_value=self.client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(genius_utils._lyrics_cache.clear)
+
+    def test_lyrics_are_fetched_once_per_track(self):
+        self.client.search_song.return_value = mock.Mock(lyrics="la la la")
+        self.assertEqual(genius_utils.get_lyrics("Song", "Artist"), "la la la")
+        self.assertEqual(genius_utils.get_lyrics("Song", "Artist"), "la la la")
+        self.client.search_song.assert_called_once_with("Song", "Artist")
+
+    def test_errors_are_not_cached(self):
+        self.client.search_song.side_effect = [
+            RuntimeError("timeout"),
+            mock.Mock(lyrics="words"),
+        ]
+        self.assertIsNone(genius_utils.get_lyrics("Song", "Artist"))
+        self.assertEqual(genius_utils.get_lyrics("Song", "Artist"), "words")
+
+    def test_misses_expire(self):
+        self.client.search_song.side_effect = [None, mock.Mock(lyrics="found")]
+        self.assertIsNone(genius_utils.get_lyrics("Song", "Artist"))
+        self.assertIsNone(genius_utils.get_lyrics("Song", "Artist"))
+        self.client.search_song.assert_called_once()
+
+        with mock.patch.object(genius_utils, "LYRICS_MISS_TTL", 0):
+            self.assertEqual(genius_utils.get_lyrics("Song", "Artist"), "found")
+
+    def test_missing_client_is_not_cached(self):
+        with mock.patch.object(genius_utils, "_get_genius_client", return_value=None):
+            self.assertIsNone(genius_utils.get_lyrics("Song", "Artist"))
+        self.client.search_song.return_value = mock.Mock(lyrics="words")
+        self.assertEqual(genius_utils.get_lyrics("Song", "Artist"), "words")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import json_utils
+
+
+class JsonUtilsTest(unittest.TestCase):
+    def test_round_trip_keeps_unicode(self):
+        entry = {"track_name": "Björk – Jóga", "liked": True, "count": 2}
+        encoded = json_utils.dumps(entry)
+        self.assertIsInstance(encoded, bytes)
+        self.assertIn("Jóga".encode("utf-8"), encoded)
+        self.assertEqual(json_utils.loads(encoded), entry)
+
+    def test_stdlib_fallback_matches_output(self):
+        entry = {"a": [1, 2], "b": "ü"}
+        with mock.patch.object(json_utils, "orjson", None):
+            compact = json_utils.dumps(entry)
+            indented = json_utils.dumps(entry, indent=True)
+            self.assertEqual(json_utils.loads(compact), entry)
+        self.assertEqual(compact, json_utils.dumps(entry))
+        self.assertEqual(json.loads(indented), entry)
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_utils.loads("{'single': 'quotes'}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,18 @@
-import sys, os
-import unittest
-import time
-
 import os
 import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import wait
+from unittest import mock
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 os.environ.setdefault("GENIUS_API_TOKEN", "dummy")
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from lyrics_sync import LyricsSyncManager
-
-
-class DummySpotify:
-    pass
+from tests._fakes import DummySpotify
 
 
 class LyricsSyncTest(unittest.TestCase):
@@ -32,11 +30,7 @@ class LyricsSyncTest(unittest.TestCase):
         duration = time.time() - start_time
         self.assertLess(duration, 0.05)
 
-        # wait for background thread to finish
-        timeout = time.time() + 1
-        while mgr.fetching and time.time() < timeout:
-            time.sleep(0.05)
-
+        self.assertTrue(mgr.ready_event.wait(timeout=1))
         self.assertTrue(mgr.ready)
         self.assertEqual(mgr.lines, ["line1", "line2"])
 
@@ -68,6 +62,143 @@ class LyricsSyncTest(unittest.TestCase):
         self.assertTrue(mgr.ready)
         self.assertEqual(mgr.lines, ["cached"])
 
+    def test_start_shares_prefetch_in_flight(self):
+        mgr = LyricsSyncManager(DummySpotify())
+        calls = []
+
+        def fake_fetch(artist_name, track_name, **k):
+            calls.append(track_name)
+            time.sleep(0.1)
+            return [0], [track_name]
+
+        mgr.fetch_lyrics = fake_fetch
+        mgr.prefetch("Song", "Artist", duration_ms=2000)
+        mgr.start("Song", "Artist", duration_ms=2000)
+        self.assertTrue(mgr.ready_event.wait(timeout=1))
+
+        self.assertEqual(calls, ["Song"])
+        self.assertEqual(mgr.lines, ["Song"])
+
+    def test_prefetch_upcoming_fetches_each_track_once(self):
+        mgr = LyricsSyncManager(DummySpotify())
+        calls = []
+
+        def fake_fetch(artist_name, track_name, **k):
+            calls.append(track_name)
+            time.sleep(0.05)
+            return [0], [track_name]
+
+        mgr.fetch_lyrics = fake_fetch
+        upcoming = [("A", "X"), ("B", "Y"), ("A", "X"), (None, "Z")]
+        mgr.prefetch_upcoming(upcoming)
+        mgr.prefetch_upcoming(upcoming)
+        time.sleep(0.3)
+
+        self.assertEqual(sorted(calls), ["A", "B"])
+        self.assertEqual(set(mgr._cache), {("A", "X"), ("B", "Y")})
+
+    def test_prefetch_miss_is_not_retried_until_ttl(self):
+        mgr = LyricsSyncManager(DummySpotify())
+        calls = []
+
+        def fake_fetch(artist_name, track_name, **k):
+            calls.append(track_name)
+            return [], []
+
+        mgr.fetch_lyrics = fake_fetch
+        for _ in range(3):
+            mgr.prefetch("Rare", "Artist", duration_ms=2000)
+            wait(list(mgr._prefetching.values()))
+            time.sleep(0.02)
+        self.assertEqual(calls, ["Rare"])
+
+        with mock.patch.object(LyricsSyncManager, "PREFETCH_MISS_TTL", 0):
+            mgr.prefetch("Rare", "Artist", duration_ms=2000)
+            wait(list(mgr._prefetching.values()))
+        self.assertEqual(calls, ["Rare", "Rare"])
+
+    def test_stale_fetch_does_not_overwrite_newer_track(self):
+        mgr = LyricsSyncManager(DummySpotify())
+
+        def fake_fetch(artist_name, track_name, **k):
+            time.sleep(0.15 if track_name == "Old" else 0)
+            return [0], [track_name]
+
+        mgr.fetch_lyrics = fake_fetch
+        mgr.start("Old", "Artist", duration_ms=2000)
+        old_future = mgr._future
+        mgr.start("New", "Artist", duration_ms=2000)
+        self.assertTrue(mgr.ready_event.wait(timeout=1))
+        # the old fetch either ran to completion or was cancelled while queued
+        wait([old_future], timeout=1)
+        time.sleep(0.05)
+
+        self.assertEqual(mgr.lines, ["New"])
+        self.assertTrue(mgr.ready)
+
+    def test_skipping_cancels_fetch_that_has_not_started(self):
+        mgr = LyricsSyncManager(DummySpotify())
+        release = threading.Event()
+        calls = []
+
+        def fake_fetch(artist_name, track_name, **k):
+            calls.append(track_name)
+            release.wait(1)
+            return [0], [track_name]
+
+        mgr.fetch_lyrics = fake_fetch
+        # occupy both pool workers so the next fetch stays queued
+        mgr.prefetch("Busy1", "Artist", duration_ms=2000)
+        mgr.prefetch("Busy2", "Artist", duration_ms=2000)
+        mgr.start("Skipped", "Artist", duration_ms=2000)
+        skipped = mgr._future
+        mgr.start("Current", "Artist", duration_ms=2000)
+        release.set()
+
+        self.assertTrue(mgr.ready_event.wait(timeout=2))
+        self.assertTrue(skipped.cancelled())
+        self.assertNotIn("Skipped", calls)
+        self.assertEqual(mgr.lines, ["Current"])
+
+    def test_parse_lrc_skips_tags_and_handles_crlf(self):
+        mgr = LyricsSyncManager(DummySpotify())
+        lrc = "[ar:Artist]\r\n[00:01.50] hi\r\nnoise\n[01:02.25]bye\n"
+        self.assertEqual(mgr.parse_lrc(lrc), ([1500, 62250], ["hi", "bye"]))
+
+    def test_sync_skips_calls_within_same_bucket(self):
+        mgr = LyricsSyncManager(DummySpotify())
+        mgr.timestamps, mgr.lines = [0, 1000, 2000], ["a", "b", "c"]
+
+        mgr.sync(1050)
+        self.assertEqual(mgr.current_index, 1)
+
+        mgr.timestamps = [0, 1000, 1060]
+        mgr.sync(1099)
+        self.assertEqual(mgr.current_index, 1)
+
+        mgr.sync(1100)
+        self.assertEqual(mgr.current_index, 2)
+
+    def test_fetched_lyrics_persist_across_managers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lyrics.json")
+            response = mock.Mock(status_code=200, url="lrclib")
+            response.text = '{"syncedLyrics": "[00:01.00] hello"}'
+
+            mgr = LyricsSyncManager(DummySpotify(), cache_path=path)
+            mgr.session = mock.Mock()
+            mgr.session.get.return_value = response
+            first = mgr.fetch_lyrics("Artist", "Song", "", 2000)
+            mgr.disk_cache.flush()
+
+            reloaded = LyricsSyncManager(DummySpotify(), cache_path=path)
+            reloaded.session = mock.Mock()
+            second = reloaded.fetch_lyrics("ARTIST", "song", "", 0)
+            reloaded.session.get.assert_not_called()
+
+        self.assertEqual(first, ([1000], ["hello"]))
+        self.assertEqual(second, first)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,42 +3,12 @@ import os
 import sys
 import unittest
 
+from rich.text import Text
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from mystery_mode import MysteryModeManager
-
-
-class DummyLogger:
-    def warning(self, *args, **kwargs):
-        pass
-
-    def error(self, *args, **kwargs):
-        pass
-
-
-class DummyDJ:
-    def __init__(self, response: str):
-        self.response = response
-        self.logger = DummyLogger()
-
-    def ask(self, prompt, cancel_event=None):
-        return self.response
-
-
-class DummySpotify:
-    def __init__(self):
-        self.queued: list[str] = []
-        self.played: list[str] = []
-
-    def search_track(self, track, artist):
-        return f"uri:{track}:{artist}"
-
-    def add_to_queue(self, uri):
-        self.queued.append(uri)
-
-    def play_track(self, uri):
-        self.played.append(uri)
+from tests._fakes import DummyDJ, DummySpotify
 
 
 class MysteryModeManagerTest(unittest.TestCase):
@@ -94,6 +64,18 @@ class MysteryModeManagerTest(unittest.TestCase):
         self.assertFalse(manager.awaiting_choice)
         self.assertEqual(sp.played, ["uri:Song C:Artist C"])
 
+    def test_display_escapes_markup_in_titles(self):
+        response = json.dumps(
+            {"options": [{"track_name": "Song [Remix]", "artist_name": "[bold]A"}]}
+        )
+        manager = MysteryModeManager(DummyDJ(response), DummySpotify(), "{song_name}")
+        manager.enabled = True
+
+        display = manager.activate_round("Now", "Artist")
+
+        plain = Text.from_markup(display).plain
+        self.assertIn("1. Song [Remix] — [bold]A", plain)
+
     def test_activate_round_handles_bad_json(self):
         dj = DummyDJ("not json")
         sp = DummySpotify()
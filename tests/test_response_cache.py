@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from response_cache import ResponseCache
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache", "gpt.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_depends_on_every_part(self):
+        key = ResponseCache.key("gpt-4o", "", "prompt")
+        self.assertEqual(key, ResponseCache.key("gpt-4o", "", "prompt"))
+        self.assertNotEqual(key, ResponseCache.key("gpt-4o-mini", "", "prompt"))
+        self.assertNotEqual(key, ResponseCache.key("gpt-4o", "prompt", ""))
+
+    def test_entries_persist_across_instances(self):
+        cache = ResponseCache(self.path)
+        cache.put("k", "answer")
+        cache.flush()
+
+        reloaded = ResponseCache(self.path)
+        self.assertEqual(reloaded.get("k"), "answer")
+        self.assertIsNone(reloaded.get("missing"))
+
+    def test_burst_of_puts_is_written_once(self):
+        cache = ResponseCache(self.path)
+        with mock.patch.object(cache, "_save", wraps=cache._save) as save:
+            for i in range(10):
+                cache.put(str(i), "answer")
+            self.assertFalse(os.path.exists(self.path))
+            cache.flush()
+            cache.flush()
+        save.assert_called_once()
+        self.assertEqual(ResponseCache(self.path).get("9"), "answer")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(None, max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+
+    def test_corrupt_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("not json")
+        self.assertIsNone(ResponseCache(self.path).get("k"))
+
+
+if __name__ == "__main__":
+    unittest.main()
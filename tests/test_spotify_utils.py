@@ -1,4 +1,7 @@
+import tempfile
+import time
 import unittest
+from unittest import mock
 from unittest.mock import MagicMock
 
 import sys, os
@@ -6,11 +9,25 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from spotify_utils import SpotifyController
 
+
+def make_controller(uri_cache_path):
+    """Build a controller with Spotipy's client and OAuth patched out."""
+    with mock.patch("spotipy.Spotify", return_value=MagicMock()), mock.patch(
+        "spotipy.oauth2.SpotifyOAuth"
+    ):
+        ctrl = SpotifyController(uri_cache_path=uri_cache_path)
+    ctrl.logger = MagicMock()
+    return ctrl
+
+
 class SpotifyControllerTest(unittest.TestCase):
     def setUp(self):
-        self.ctrl = SpotifyController.__new__(SpotifyController)
-        self.ctrl.sp = MagicMock()
-        self.ctrl.logger = MagicMock()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.uri_path = os.path.join(tmp.name, "uris.json")
+        self.ctrl = make_controller(self.uri_path)
+        # Write pending URIs before the directory goes away.
+        self.addCleanup(self.ctrl.uri_store.flush)
 
     def test_restart_track_calls_seek(self):
         self.ctrl.restart_track()
@@ -21,5 +38,109 @@ class SpotifyControllerTest(unittest.TestCase):
         self.ctrl.skip_to_end()
         self.ctrl.sp.seek_track.assert_called_with(9000)
 
+    def test_repeated_volume_presses_build_on_each_other(self):
+        state = {"volume_percent": 50}
+        self.ctrl.sp.current_playback.side_effect = lambda: {"device": dict(state)}
+        self.ctrl.sp.volume.side_effect = lambda v: state.update(volume_percent=v)
+        self.ctrl.current_playback()
+        self.ctrl.change_volume(+10)
+        self.ctrl.change_volume(+10)
+        self.assertEqual(state["volume_percent"], 70)
+
+    def test_search_track_reads_uris_persisted_by_earlier_session(self):
+        self.ctrl.sp.search.return_value = {
+            "tracks": {"items": [{"uri": "spotify:track:9"}]}
+        }
+        self.ctrl.search_track("Song", "Artist")
+        self.ctrl.uri_store.flush()
+
+        fresh = make_controller(self.uri_path)
+        self.assertEqual(fresh.search_track("song", "ARTIST"), "spotify:track:9")
+        fresh.sp.search.assert_not_called()
+
+    def test_search_tracks_keeps_order_with_slow_searches(self):
+        def search(q, type, limit):
+            if "first" in q:
+                time.sleep(0.05)
+            return {"tracks": {"items": [{"uri": q}]}}
+
+        self.ctrl.sp.search.side_effect = search
+        pairs = [("first", "A"), ("second", "B"), ("third", "C")]
+        self.assertEqual(
+            self.ctrl.search_tracks(pairs),
+            [f"track:{t} artist:{a}" for t, a in pairs],
+        )
+
+    def test_bulk_tracks_chunks_by_fifty_and_keeps_alignment(self):
+        ids = [f"id{i}" for i in range(51)]
+        self.ctrl.sp.tracks.side_effect = [
+            {"tracks": [{"id": i} for i in ids[:50]]},
+            RuntimeError("boom"),
+        ]
+        tracks = self.ctrl.bulk_tracks(ids)
+        self.assertEqual(self.ctrl.sp.tracks.call_count, 2)
+        self.assertEqual(len(tracks), 51)
+        self.assertEqual(tracks[49], {"id": "id49"})
+        self.assertIsNone(tracks[50])
+
+    def test_play_track_starts_on_device_in_one_call(self):
+        self.ctrl.sp.devices.return_value = {"devices": [{"id": "dev1"}]}
+        self.ctrl.play_track("spotify:track:1")
+        self.ctrl.sp.start_playback.assert_called_once_with(
+            device_id="dev1", uris=["spotify:track:1"]
+        )
+        self.ctrl.sp.transfer_playback.assert_not_called()
+
+    def test_play_track_reuses_device_until_a_play_fails(self):
+        self.ctrl.sp.devices.return_value = {"devices": [{"id": "dev1"}]}
+        self.ctrl.play_track("spotify:track:1")
+        self.ctrl.play_track("spotify:track:2")
+        self.ctrl.sp.devices.assert_called_once()
+
+        self.ctrl.sp.start_playback.side_effect = RuntimeError("404")
+        self.ctrl.play_track("spotify:track:3")
+        self.ctrl.sp.start_playback.side_effect = None
+        self.ctrl.play_track("spotify:track:4")
+        self.assertEqual(self.ctrl.sp.devices.call_count, 2)
+
+    def test_device_id_prefers_recent_playback_device(self):
+        self.ctrl.sp.current_playback.return_value = {"device": {"id": "active"}}
+        self.ctrl.current_playback()
+        self.assertEqual(self.ctrl.device_id(), "active")
+        self.ctrl.sp.devices.assert_not_called()
+
+    def test_current_playback_reuses_recent_snapshot(self):
+        self.ctrl.sp.current_playback.return_value = {"is_playing": True}
+        first = self.ctrl.current_playback()
+        second = self.ctrl.current_playback()
+        self.assertIs(first, second)
+        self.assertEqual(self.ctrl.sp.current_playback.call_count, 1)
+
+        self.ctrl.current_playback(max_age=0)
+        self.assertEqual(self.ctrl.sp.current_playback.call_count, 2)
+
+    def test_playback_changes_invalidate_snapshot(self):
+        self.ctrl.sp.current_playback.return_value = {"is_playing": True}
+        self.ctrl.current_playback()
+        self.ctrl.pause()
+        self.ctrl.current_playback()
+        self.assertEqual(self.ctrl.sp.current_playback.call_count, 2)
+
+    def test_search_track_caches_by_casefolded_key(self):
+        self.ctrl.sp.search.return_value = {
+            "tracks": {"items": [{"uri": "spotify:track:1"}]}
+        }
+        self.assertEqual(self.ctrl.search_track("Song", "Artist"), "spotify:track:1")
+        self.assertEqual(self.ctrl.search_track("SONG", "artist"), "spotify:track:1")
+        self.ctrl.sp.search.assert_called_once()
+
+    def test_search_track_does_not_cache_errors(self):
+        self.ctrl.sp.search.side_effect = [
+            RuntimeError("boom"),
+            {"tracks": {"items": [{"uri": "spotify:track:2"}]}},
+        ]
+        self.assertIsNone(self.ctrl.search_track("Song", "Artist"))
+        self.assertEqual(self.ctrl.search_track("Song", "Artist"), "spotify:track:2")
+
 if __name__ == '__main__':
     unittest.main()
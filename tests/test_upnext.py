@@ -1,59 +1,18 @@
 import sys, os
 
 os.environ.setdefault("GENIUS_API_TOKEN", "dummy")
+import io
 import unittest
 import json
 
+from rich.console import Console
+
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from tests._fakes import DummyDJ, DummySpotify
 from upnext import UpNextManager
 
 
-class DummyDJ:
-    def __init__(self):
-        class L:
-            def info(self, *a, **k):
-                pass
-
-            def warning(self, *a, **k):
-                pass
-
-            def error(self, *a, **k):
-                pass
-
-        self.logger = L()
-
-    def ask(self, prompt, cancel_event=None):
-        return "{}"
-
-
-class BatchDJ(DummyDJ):
-    def __init__(self, response):
-        super().__init__()
-        self.calls = 0
-        self.response = response
-
-    def ask(self, prompt, cancel_event=None):
-        self.calls += 1
-        return self.response
-
-
-class DummySpotify:
-    def search_track(self, track, artist):
-        return f"uri:{track}:{artist}"
-
-    def add_to_queue(self, uri):
-        pass
-
-
-class CaptureSpotify(DummySpotify):
-    def __init__(self):
-        self.added = []
-
-    def add_to_queue(self, uri):
-        self.added.append(uri)
-
-
 class UpNextTest(unittest.TestCase):
     def test_recent_track_skip(self):
         mgr = UpNextManager(DummyDJ(), DummySpotify(), {})
@@ -68,8 +27,8 @@ class UpNextTest(unittest.TestCase):
                 for i in range(6)
             ]
         )
-        dj = BatchDJ(response)
-        sp = CaptureSpotify()
+        dj = DummyDJ(response)
+        sp = DummySpotify()
         mgr = UpNextManager(dj, sp, {"auto_dj_batch": ""})
         mgr.auto_dj_enabled = True
         mgr.maintain_queue("Current", "Artist")
@@ -77,6 +36,19 @@ class UpNextTest(unittest.TestCase):
         self.assertEqual(dj.calls, 1)
         self.assertIn(("Current", "Artist"), mgr.recent_tracks)
 
+    def test_batch_accepts_fenced_and_line_delimited_objects(self):
+        response = (
+            "Here you go:\n```json\n"
+            '{"track_name": "Song1", "artist_name": "Artist1", "intro": ""}\n'
+            '{"track_name": "Song2", "artist_name": "Artist2", "intro": ""}\n'
+            "{broken\n```"
+        )
+        sp = DummySpotify()
+        mgr = UpNextManager(DummyDJ(response), sp, {"auto_dj_batch": ""})
+        mgr.auto_dj_enabled = True
+        mgr.maintain_queue("Current", "Artist")
+        self.assertEqual(sp.queued, ["uri:Song1:Artist1", "uri:Song2:Artist2"])
+
     def test_batch_called_once(self):
         response = json.dumps(
             [
@@ -84,8 +56,8 @@ class UpNextTest(unittest.TestCase):
                 {"track_name": "Song2", "artist_name": "Artist2", "intro": "hi"},
             ]
         )
-        dj = BatchDJ(response)
-        sp = CaptureSpotify()
+        dj = DummyDJ(response)
+        sp = DummySpotify()
         mgr = UpNextManager(dj, sp, {"auto_dj_batch": ""})
         mgr.auto_dj_enabled = True
         mgr.maintain_queue("Song0", "Artist0")
@@ -93,6 +65,131 @@ class UpNextTest(unittest.TestCase):
         mgr.maintain_queue("Song0", "Artist0")
         self.assertEqual(dj.calls, 1)
 
+    def test_refills_before_queue_runs_dry(self):
+        response = json.dumps(
+            [
+                {"track_name": f"Song{i}", "artist_name": "Artist", "intro": ""}
+                for i in range(1, 3)
+            ]
+        )
+        dj = DummyDJ(response)
+        mgr = UpNextManager(dj, DummySpotify(), {"auto_dj_batch": ""})
+        mgr.auto_dj_enabled = True
+        mgr.maintain_queue("Song0", "Artist")
+        self.assertEqual(dj.calls, 1)
+
+        # Song1 starts playing: it leaves the queue and one track remains,
+        # so the next batch is requested while Song1 plays.
+        dj.response = json.dumps(
+            [{"track_name": "Song3", "artist_name": "Artist", "intro": ""}]
+        )
+        mgr.maintain_queue("song1", "ARTIST")
+        self.assertEqual(dj.calls, 2)
+        self.assertEqual([t["track_name"] for t in mgr.queue], ["Song2", "Song3"])
+
+    def test_empty_batch_is_not_retried_immediately(self):
+        dj = DummyDJ("[]")
+        mgr = UpNextManager(dj, DummySpotify(), {"auto_dj_batch": ""})
+        mgr.auto_dj_enabled = True
+        mgr.maintain_queue("Song", "Artist")
+        mgr.maintain_queue("Song", "Artist")
+        self.assertEqual(dj.calls, 1)
+
+    def test_auto_dj_transition_gets_intro_in_same_call(self):
+        response = json.dumps(
+            {"track_name": "Next", "artist_name": "Band", "intro": "Up next!"}
+        )
+        dj = DummyDJ(response)
+        sp = DummySpotify()
+        templates = {"auto_dj": "{song_name}", "auto_dj_with_intro": "{song_name}"}
+        mgr = UpNextManager(dj, sp, templates)
+        mgr.console = Console(file=io.StringIO())
+
+        self.assertTrue(mgr.auto_dj_transition("Song", "Artist"))
+        self.assertEqual(dj.calls, 1)
+        self.assertEqual(mgr.intros_shown, 1)
+        self.assertIn("Up next!", mgr.console.file.getvalue())
+
+    def test_auto_dj_transition_accepts_python_style_answer(self):
+        response = (
+            "{'track_name': 'Next', 'artist_name': 'Band', "
+            "'intro': \"Don't touch that dial\"}"
+        )
+        sp = DummySpotify()
+        mgr = UpNextManager(DummyDJ(response), sp, {"auto_dj": "{song_name}"})
+        mgr.console = Console(file=io.StringIO())
+
+        self.assertTrue(mgr.auto_dj_transition("Song", "Artist"))
+        self.assertEqual(sp.queued, ["uri:Next:Band"])
+        self.assertIn("Don't touch that dial", mgr.console.file.getvalue())
+
+    def test_queue_ten_songs_parses_numbered_lines(self):
+        response = (
+            "Here you go:\n"
+            "1. Stand by Me by Ben E. King\n"
+            "2. Mr. Brightside by The Killers\n"
+            "no number by nobody\n"
+        )
+        sp = DummySpotify()
+        mgr = UpNextManager(
+            DummyDJ(response), sp, {"recommend_next_ten_songs": "{song_name}"}
+        )
+        mgr.console = Console(file=io.StringIO())
+        mgr.queue_ten_songs("Song", "Artist")
+        self.assertEqual(
+            sp.queued,
+            [
+                "uri:Stand by Me:Ben E. King",
+                "uri:Mr. Brightside:The Killers",
+            ],
+        )
+
+    def test_long_list_keeps_the_tracks_that_play_next(self):
+        response = "\n".join(f"{i}. Song{i} by Artist{i}" for i in range(1, 11))
+        mgr = UpNextManager(
+            DummyDJ(response), DummySpotify(), {"recommend_next_ten_songs": ""}
+        )
+        mgr.console = Console(file=io.StringIO())
+        mgr.queue_ten_songs("Song", "Artist")
+        self.assertEqual(len(mgr.queue), 10)
+        self.assertEqual(mgr.queue[0]["track_name"], "Song1")
+
+        mgr.maintain_queue("Song1", "Artist1")
+        self.assertEqual(mgr.queue[0]["track_name"], "Song2")
+
+    def test_played_track_is_dropped_by_uri_despite_title_variant(self):
+        response = "\n".join(f"{i}. Song{i} by Artist{i}" for i in range(1, 4))
+        mgr = UpNextManager(
+            DummyDJ(response), DummySpotify(), {"recommend_next_ten_songs": ""}
+        )
+        mgr.console = Console(file=io.StringIO())
+        mgr.queue_ten_songs("Song", "Artist")
+
+        mgr.maintain_queue(
+            "Song2 - Remastered 2011", "Artist2", "uri:Song2:Artist2"
+        )
+        self.assertEqual([t["track_name"] for t in mgr.queue], ["Song3"])
+
+    def test_queue_one_song_accepts_python_style_dict(self):
+        response = "{'track_name': \"Don't Stop Believin'\", 'artist_name': 'Journey'}"
+        sp = DummySpotify()
+        mgr = UpNextManager(
+            DummyDJ(response), sp, {"recommend_next_song": "{song_name}"}
+        )
+        mgr.console = Console(file=io.StringIO())
+        mgr.queue_one_song("Song", "Artist")
+        self.assertEqual(sp.queued, ["uri:Don't Stop Believin':Journey"])
+
+    def test_queue_one_song_accepts_fenced_json(self):
+        response = 'Try this:\n```json\n{"track_name": "Hey", "artist_name": "Pixies"}\n```'
+        sp = DummySpotify()
+        mgr = UpNextManager(
+            DummyDJ(response), sp, {"recommend_next_song": "{song_name}"}
+        )
+        mgr.console = Console(file=io.StringIO())
+        mgr.queue_one_song("Song", "Artist")
+        self.assertEqual(sp.queued, ["uri:Hey:Pixies"])
+
 
 if __name__ == "__main__":
     unittest.main()
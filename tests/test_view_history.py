@@ -0,0 +1,34 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import json_utils
+import view_history
+
+
+class ViewHistoryTest(unittest.TestCase):
+    def test_load_history_decodes_only_the_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "song_history.jsonl")
+            with open(path, "wb") as f:
+                for i in range(10):
+                    f.write(json_utils.dumps({"track_name": f"t{i}"}) + b"\n")
+                f.write(b"\n")
+            with mock.patch.object(view_history, "HISTORY_FILE", path):
+                tail = view_history.load_history(limit=3)
+                everything = view_history.load_history()
+        self.assertEqual([e["track_name"] for e in tail], ["t7", "t8", "t9"])
+        self.assertEqual(len(everything), 10)
+
+    def test_tail_lines_handles_missing_newline_and_short_files(self):
+        data = b'{"a": 1}\n\n{"a": 2}'
+        self.assertEqual(view_history._tail_lines(data, 5), [b'{"a": 1}', b'{"a": 2}'])
+        self.assertEqual(view_history._tail_lines(data, 1), [b'{"a": 2}'])
+
+
+if __name__ == "__main__":
+    unittest.main()
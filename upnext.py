@@ -4,9 +4,15 @@ This module also loads user settings from ``settings.json`` which define the
 DJ host persona, chatter level and the number of intros to display.
 """
 
+import ast
 import json
 import os
-from gpt_utils import parse_json_response
+import re
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+import json_utils
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
@@ -20,14 +26,92 @@ DEFAULT_SETTINGS = {
     "intro_count": 3,
     "chatter_level": "normal",
 }
-try:
-    with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-        SETTINGS = {**DEFAULT_SETTINGS, **json.load(f)}
-except Exception:
-    SETTINGS = DEFAULT_SETTINGS
+
+
+@lru_cache(maxsize=1)
+def _load_settings() -> dict:
+    """Return ``settings.json`` merged over :data:`DEFAULT_SETTINGS`."""
+
+    try:
+        with open(SETTINGS_PATH, "rb") as f:
+            return {**DEFAULT_SETTINGS, **json_utils.loads(f.read())}
+    except (FileNotFoundError, json_utils.JSONDecodeError):
+        return DEFAULT_SETTINGS
+
+
+SETTINGS = _load_settings()
+
+# Auto-DJ runs every few tracks; only the head of each prompt and response
+# goes to the log (GPTDJ.ask already records full responses).
+_MAX_LOG_CHARS = 512
+
+# "1. Track by Artist" lines from list-style GPT answers. The greedy title
+# splits on the last " by " so titles like "Stand by Me" survive.
+_NUMBERED_TRACK_RE = re.compile(r"^\s*\d+\.\s*(.+) by (.+?)\s*$", re.MULTILINE)
+
+
+def parse_numbered_tracks(response: str) -> list[tuple[str, str]]:
+    """Return ``(track, artist)`` pairs from a numbered GPT song list."""
+
+    return [
+        (track.strip(), artist)
+        for track, artist in _NUMBERED_TRACK_RE.findall(response)
+    ]
+
+
+def iter_json_objects(response: str):
+    """Yield every top-level JSON object found in *response*.
+
+    Handles a JSON array of objects, newline-delimited objects and objects
+    wrapped in prose or code fences alike, decoding one object at a time so
+    a malformed entry only loses that entry.
+    """
+
+    decoder = json.JSONDecoder()
+    index = 0
+    while (start := response.find("{", index)) != -1:
+        try:
+            obj, index = decoder.raw_decode(response, start)
+        except json.JSONDecodeError:
+            index = start + 1
+            continue
+        if isinstance(obj, dict):
+            yield obj
+
+
+def parse_track_response(response: str):
+    """Parse a single-track GPT answer, or return ``None`` if unparseable.
+
+    JSON is tried first; Python-style dicts (single quotes, apostrophes in
+    titles such as ``"Don't Stop Believin'"``) fall back to
+    :func:`ast.literal_eval`, and answers that wrap the object in prose or a
+    code fence to the first object :func:`iter_json_objects` finds.
+    """
+
+    try:
+        return json_utils.loads(response)
+    except json_utils.JSONDecodeError:
+        pass
+    try:
+        return ast.literal_eval(response.strip())
+    except (ValueError, SyntaxError):
+        pass
+    return next(iter_json_objects(response), None)
+
+
+def ask_theme() -> str:
+    """Prompt the user for a playlist theme."""
+
+    return Prompt.ask("Enter a theme (e.g., focus, happy, roadtrip)").strip()
 
 
 class UpNextManager:
+    # Auto-DJ asks for the next batch while this few tracks are still queued,
+    # so the GPT round trip overlaps the current song instead of a skip.
+    REFILL_BELOW = 2
+    # Seconds to wait before asking again after a batch queued nothing.
+    REFILL_RETRY_SECONDS = 30.0
+
     @property
     def playlist_mode(self):
         return self.mode == "playlist"
@@ -60,11 +144,20 @@ class UpNextManager:
         self.sp = spotify_controller
         self.templates = prompt_templates
         self.cancel_event = cancel_event
-        self.queue = []
+        # Tracks this manager queued on Spotify, in play order. Unbounded on
+        # purpose: a maxlen would evict from the left, dropping the tracks
+        # that play next when a playlist queues more than it holds. Entries
+        # leave through ``_drop_played``; Auto-DJ batches cap themselves.
+        # Mutated only under ``_queue_lock``; readers on other threads must
+        # copy it in one step (``islice``/``list``) rather than iterate it
+        # from Python code.
+        self.queue: deque[dict[str, str]] = deque()
+        self._queue_lock = threading.Lock()
         self.mode = "smart"
         self.console = Console()
         self.auto_dj_enabled = False
-        self.recent_tracks: list[tuple[str, str]] = []
+        self.recent_tracks: deque[tuple[str, str]] = deque(maxlen=100)
+        self._next_refill_at = float("-inf")
 
         cfg = config or SETTINGS
         self.host_name: str = cfg.get("host_name", DEFAULT_SETTINGS["host_name"])
@@ -76,39 +169,75 @@ class UpNextManager:
         )
         self.intros_shown: int = 0
 
-    def _queue_track(self, track_name: str, artist_name: str) -> bool:
-        """Search Spotify and queue the track if found."""
+    def _should_queue(self, track_name: str, artist_name: str) -> bool:
+        """Return ``False`` for incomplete, recently played or queued tracks."""
         if not track_name or not artist_name:
             return False
         if (track_name, artist_name) in self.recent_tracks:
             self.dj.logger.info(
-                f"Skipping recently played track: {track_name} by {artist_name}"
+                "Skipping recently played track: %s by %s", track_name, artist_name
             )
             return False
-        if any(
-            t["track_name"] == track_name and t["artist_name"] == artist_name
-            for t in self.queue
-        ):
+        with self._queue_lock:
+            return not any(
+                t["track_name"] == track_name and t["artist_name"] == artist_name
+                for t in self.queue
+            )
+
+    def _queue_track(self, track_name: str, artist_name: str) -> bool:
+        """Search Spotify and queue the track if found."""
+        if not self._should_queue(track_name, artist_name):
             return False
         uri = self.sp.search_track(track_name, artist_name)
+        return self._add_resolved(track_name, artist_name, uri)
+
+    def _queue_tracks(
+        self, pairs: list[tuple[str, str]], limit: int | None = None
+    ) -> list[tuple[str, str]]:
+        """Queue ``pairs`` in order, resolving their URIs concurrently first.
+
+        Stops once the local queue holds ``limit`` tracks and returns the
+        pairs that were actually queued.
+        """
+        wanted: list[tuple[str, str]] = []
+        for pair in pairs:
+            if pair not in wanted and self._should_queue(*pair):
+                wanted.append(pair)
+        queued = []
+        for pair, uri in zip(wanted, self.sp.search_tracks(wanted)):
+            if limit is not None and len(self.queue) >= limit:
+                break
+            if self._add_resolved(*pair, uri):
+                queued.append(pair)
+        return queued
+
+    def _add_resolved(
+        self, track_name: str, artist_name: str, uri: str | None
+    ) -> bool:
+        """Add an already-searched track to Spotify's and the local queue."""
         if uri:
             self.sp.add_to_queue(uri)
-            self.queue.append({"track_name": track_name, "artist_name": artist_name})
-            self.dj.logger.info(f"Queued track: {track_name} by {artist_name}")
+            with self._queue_lock:
+                self.queue.append(
+                    {"track_name": track_name, "artist_name": artist_name, "uri": uri}
+                )
+            self.dj.logger.info("Queued track: %s by %s", track_name, artist_name)
             return True
         self.dj.logger.warning(
-            f"Track not found for queueing: {track_name} by {artist_name}"
+            "Track not found for queueing: %s by %s", track_name, artist_name
         )
         return False
 
     def show_queue(self):
         """Display the currently queued tracks."""
-        if not self.queue:
+        with self._queue_lock:
+            queued = list(self.queue)
+        if not queued:
             self.console.print("[dim]Queue is empty.[/dim]")
             return
         lines = [
             f"{i}. {t['track_name']} - {t['artist_name']}"
-            for i, t in enumerate(self.queue, 1)
+            for i, t in enumerate(queued, 1)
         ]
         self.console.print(
             Panel("\n".join(lines), title="Up Next", border_style="blue")
@@ -122,43 +251,103 @@ class UpNextManager:
             )
         )
 
-    def maintain_queue(self, current_song: str, current_artist: str) -> None:
-        """Ensure the queue is populated when Auto-DJ mode is active."""
+    def maintain_queue(
+        self, current_song: str, current_artist: str, current_uri: str | None = None
+    ) -> None:
+        """Ensure the queue is populated when Auto-DJ mode is active.
+
+        ``current_uri`` is the playing track's Spotify URI (as requested, i.e.
+        before relinking); with it a played entry is found even when Spotify's
+        title differs from the one GPT suggested.
+        """
 
         if current_song and current_artist:
             track = (current_song, current_artist)
             if not self.recent_tracks or self.recent_tracks[-1] != track:
                 self.recent_tracks.append(track)
-                if len(self.recent_tracks) > 100:
-                    self.recent_tracks.pop(0)
-
-        if self.auto_dj_enabled and not self.queue and current_song and current_artist:
+                self._drop_played(track, current_uri)
+
+        if (
+            self.auto_dj_enabled
+            and len(self.queue) < self.REFILL_BELOW
+            and current_song
+            and current_artist
+            and time.monotonic() >= self._next_refill_at
+        ):
+            queued = len(self.queue)
             self._auto_dj_batch(current_song, current_artist)
+            if len(self.queue) <= queued:
+                self._next_refill_at = time.monotonic() + self.REFILL_RETRY_SECONDS
 
-        if len(self.queue) > 5:
-            self.queue = self.queue[-5:]
+    def _drop_played(self, track: tuple[str, str], uri: str | None = None) -> None:
+        """Remove ``track`` and anything queued ahead of it once it plays.
+
+        Entries are matched by ``uri`` first, then by case-folded names.
+        """
+
+        playing = tuple(part.casefold() for part in track)
+        with self._queue_lock:
+            index = None
+            if uri:
+                index = next(
+                    (i for i, t in enumerate(self.queue) if t.get("uri") == uri), None
+                )
+            if index is None:
+                names = [
+                    (t["track_name"].casefold(), t["artist_name"].casefold())
+                    for t in self.queue
+                ]
+                if playing in names:
+                    index = names.index(playing)
+            if index is not None:
+                for _ in range(index + 1):
+                    self.queue.popleft()
 
     def auto_dj_transition(self, current_song, current_artist) -> bool:
-        prompt = self.templates["auto_dj"].format(
-            song_name=current_song, artist_name=current_artist
+        """Queue one follow-up track, introducing it while intros remain.
+
+        When an intro is wanted the track and its intro are requested in a
+        single ``auto_dj_with_intro`` call; a separate intro request is only
+        made if that template is missing or the answer omits the intro.
+        """
+
+        want_intro = (
+            self.chatter_level != "silent" and self.intros_shown < self.intro_count
         )
+        template = self.templates["auto_dj"]
+        if want_intro:
+            template = self.templates.get("auto_dj_with_intro", template)
+        prompt = template.format(song_name=current_song, artist_name=current_artist)
         if self.cancel_event:
             self.cancel_event.clear()
-        resp = self.dj.ask(prompt, cancel_event=self.cancel_event)
-        self.dj.logger.info(f"[auto_dj_transition] Prompt:\n{prompt}")
-        self.dj.logger.info(f"[auto_dj_transition] Raw Response:\n{resp}")
+        resp = self.dj.ask(
+            prompt, cancel_event=self.cancel_event, bypass_cache=True
+        )
+        self.dj.logger.debug(
+            "[auto_dj_transition] Prompt (%d chars):\n%.*s",
+            len(prompt),
+            _MAX_LOG_CHARS,
+            prompt,
+        )
+        self.dj.logger.debug(
+            "[auto_dj_transition] Raw Response (%d chars):\n%.*s",
+            len(resp or ""),
+            _MAX_LOG_CHARS,
+            resp,
+        )
 
         try:
-            parsed = parse_json_response(resp)
+            parsed = parse_track_response(resp or "")
+            if not isinstance(parsed, dict):
+                parsed = None
             track_name = parsed.get("track_name") if parsed else None
             artist_name = parsed.get("artist_name") if parsed else None
             if track_name and artist_name:
                 if self._queue_track(track_name, artist_name):
-                    if (
-                        self.chatter_level != "silent"
-                        and self.intros_shown < self.intro_count
-                    ):
-                        intro = self._generate_radio_intro(track_name, artist_name)
+                    if want_intro:
+                        intro = parsed.get("intro") or self._generate_radio_intro(
+                            track_name, artist_name
+                        )
                         if intro:
                             self.console.print(
                                 Panel(intro, title=" DJ Intro", border_style="blue")
@@ -172,7 +361,7 @@ class UpNextManager:
             else:
                 self.dj.logger.warning("Missing track data in GPT response.")
         except Exception as e:
-            self.dj.logger.error(f"Error parsing GPT response as JSON: {e}")
+            self.dj.logger.error("Error parsing GPT response as JSON: %s", e)
         return False
 
     def _auto_dj_batch(self, current_song: str, current_artist: str) -> None:
@@ -186,29 +375,36 @@ class UpNextManager:
         )
         if self.cancel_event:
             self.cancel_event.clear()
-        resp = self.dj.ask(prompt, cancel_event=self.cancel_event)
-        self.dj.logger.info(f"[auto_dj_batch] Prompt:\n{prompt}")
-        self.dj.logger.info(f"[auto_dj_batch] Raw Response:\n{resp}")
+        resp = self.dj.ask(
+            prompt, cancel_event=self.cancel_event, bypass_cache=True
+        )
+        self.dj.logger.debug(
+            "[auto_dj_batch] Prompt (%d chars):\n%.*s",
+            len(prompt),
+            _MAX_LOG_CHARS,
+            prompt,
+        )
+        self.dj.logger.debug(
+            "[auto_dj_batch] Raw Response (%d chars):\n%.*s",
+            len(resp or ""),
+            _MAX_LOG_CHARS,
+            resp,
+        )
 
-        try:
-            items = json.loads(resp)
-            if isinstance(items, dict):
-                items = [items]
-        except Exception as e:
-            self.dj.logger.error(f"Error parsing GPT batch response: {e}")
+        items = list(iter_json_objects(resp or ""))
+        if not items:
+            self.dj.logger.error("No track objects in GPT batch response.")
             return
 
-        for item in items:
-            track_name = item.get("track_name")
-            artist_name = item.get("artist_name")
-            intro = item.get("intro")
-            if self._queue_track(track_name, artist_name):
-                if intro:
-                    self.console.print(
-                        Panel(intro, title=" DJ Intro", border_style="blue")
-                    )
-            if len(self.queue) >= 5:
-                break
+        intros = {
+            (item.get("track_name"), item.get("artist_name")): item.get("intro")
+            for item in items
+        }
+        for pair in self._queue_tracks(list(intros), limit=5):
+            if intros[pair]:
+                self.console.print(
+                    Panel(intros[pair], title=" DJ Intro", border_style="blue")
+                )
 
     def queue_one_song(self, song_name, artist_name):
         prompt = self.templates["recommend_next_song"].format(
@@ -216,13 +412,17 @@ class UpNextManager:
         )
         if self.cancel_event:
             self.cancel_event.clear()
-        response = self.dj.ask(prompt, cancel_event=self.cancel_event)
+        response = self.dj.ask(
+            prompt, cancel_event=self.cancel_event, bypass_cache=True
+        )
         if not response:
             self.console.print("[red]No song queued.[/red]")
             return
 
-        try:
-            track = json.loads(response.replace("'", '"'))
+        track = parse_track_response(response)
+        if track is None:
+            self.console.print("[red]Failed to parse GPT response.[/red]")
+        else:
             t_name = track.get("track_name") if isinstance(track, dict) else None
             a_name = track.get("artist_name") if isinstance(track, dict) else None
             if self._queue_track(t_name, a_name):
@@ -233,8 +433,6 @@ class UpNextManager:
                 self.console.print(
                     f"[red]Could not find: {t_name or 'Unknown'} by {a_name or 'Unknown'}[/red]"
                 )
-        except json.JSONDecodeError:
-            self.console.print("[red]Failed to parse GPT response.[/red]")
         self.show_queue()
 
     def queue_ten_songs(self, song_name, artist_name):
@@ -243,22 +441,14 @@ class UpNextManager:
         )
         if self.cancel_event:
             self.cancel_event.clear()
-        response = self.dj.ask(prompt, cancel_event=self.cancel_event)
+        response = self.dj.ask(
+            prompt, cancel_event=self.cancel_event, bypass_cache=True
+        )
         if not response:
             self.console.print("[red]No songs queued.[/red]")
             return
 
-        lines = response.strip().split("\n")
-        count = 0
-        for line in lines:
-            if "." in line and " by " in line:
-                try:
-                    title = line.split(". ", 1)[1]
-                    track, artist = title.rsplit(" by ", 1)
-                    if self._queue_track(track.strip(), artist.strip()):
-                        count += 1
-                except Exception:
-                    continue
+        count = len(self._queue_tracks(parse_numbered_tracks(response)))
         self.console.print(f"[green]➕ Queued {count} songs.[/green]")
         self.show_queue()
 
@@ -268,30 +458,24 @@ class UpNextManager:
         )
         self._parse_and_queue_playlist(prompt)
 
-    def queue_theme_playlist(self):
-        theme = Prompt.ask("Enter a theme (e.g., focus, happy, roadtrip)").strip()
+    def queue_theme_playlist(self, theme: str | None = None):
+        """Queue a playlist for ``theme``, asking for one when not given."""
+        if theme is None:
+            theme = ask_theme()
         prompt = self.templates["theme_based_playlist"].format(theme=theme)
         self._parse_and_queue_playlist(prompt)
 
     def _parse_and_queue_playlist(self, prompt):
         if self.cancel_event:
             self.cancel_event.clear()
-        response = self.dj.ask(prompt, cancel_event=self.cancel_event)
+        response = self.dj.ask(
+            prompt, cancel_event=self.cancel_event, bypass_cache=True
+        )
         if not response:
             self.console.print("[red]Playlist creation failed.[/red]")
             return
 
-        lines = response.strip().split("\n")
-        count = 0
-        for line in lines:
-            if "." in line and " by " in line:
-                try:
-                    title = line.split(". ", 1)[1]
-                    track, artist = title.rsplit(" by ", 1)
-                    if self._queue_track(track.strip(), artist.strip()):
-                        count += 1
-                except Exception:
-                    continue
+        count = len(self._queue_tracks(parse_numbered_tracks(response)))
         self.mode = "playlist"
         self.console.print(f"[green]📀 Playlist queued with {count} tracks.[/green]")
         self.show_queue()
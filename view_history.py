@@ -1,26 +1,56 @@
 #!/usr/bin/env python3
 
-import json
+import json_utils
+import mmap
 import os
 from datetime import datetime
-from rich.console import Console
-from rich.table import Table
 from logger_utils import setup_logger
 
 HISTORY_FILE = os.path.expanduser("~/RadioFree/logs/song_history.jsonl")
 logger = setup_logger(__name__)
 
-def load_history():
-    """Load song history entries from the JSONL file."""
+def load_history(limit=None):
+    """Load song history entries from the JSONL file.
+
+    With ``limit`` only the last ``limit`` entries are read: the file is
+    mapped and scanned backwards for newlines, so the cost does not grow
+    with the length of the history.
+    """
     if not os.path.exists(HISTORY_FILE):
         logger.info("No song history found")
         return []
 
-    with open(HISTORY_FILE, "r") as f:
-        return [json.loads(line.strip()) for line in f if line.strip()]
+    with open(HISTORY_FILE, "rb") as f:
+        if limit is None:
+            lines = [line for line in f if line.strip()]
+        elif os.fstat(f.fileno()).st_size == 0:
+            lines = []
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = _tail_lines(mm, limit)
+    return [json_utils.loads(line) for line in lines]
+
+
+def _tail_lines(data, limit):
+    """Return the last ``limit`` non-blank lines of ``data`` (oldest first)."""
+    lines = []
+    end = len(data)
+    while end > 0 and len(lines) < limit:
+        start = data.rfind(b"\n", 0, end) + 1
+        line = data[start:end]
+        if line.strip():
+            lines.append(line)
+        end = start - 1
+    lines.reverse()
+    return lines
 
 def display_history(entries, limit=25):
     """Render a table view of recent song history."""
+    # Imported here so loading history (and the empty-history exit) does not
+    # pay for importing rich.
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Time", style="dim", width=19)
@@ -43,7 +73,7 @@ def display_history(entries, limit=25):
     console.print(table)
 
 if __name__ == "__main__":
-    history = load_history()
+    history = load_history(limit=25)
     display_history(history)
 
     print("\n[placeholder] 🚧 Last.fm sync integration coming soon.")